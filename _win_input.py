@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Win32 Input Helpers
+Direct user32 cursor, mouse and keyboard input for the universal AI controller
+"""
+
+import ctypes
+from ctypes import wintypes
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# Named keys (pyautogui names) -> virtual-key codes; single characters are
+# typed as Unicode input instead
+VK_CODES = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "shift": 0x10, "ctrl": 0x11, "alt": 0x12, "pause": 0x13,
+    "capslock": 0x14, "esc": 0x1B, "escape": 0x1B, "space": 0x20,
+    "pageup": 0x21, "pgup": 0x21, "pagedown": 0x22, "pgdn": 0x22,
+    "end": 0x23, "home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27,
+    "down": 0x28, "printscreen": 0x2C, "insert": 0x2D, "delete": 0x2E,
+    "del": 0x2E, "win": 0x5B, "winleft": 0x5B, "winright": 0x5C,
+    "apps": 0x5D,
+    **{f"f{n}": 0x6F + n for n in range(1, 25)},
+}
+
+# Control characters typed as key presses, as pyautogui.typewrite does
+CONTROL_KEYS = {"\n": "enter", "\r": "enter", "\t": "tab", "\b": "backspace"}
+
+BUTTON_FLAGS = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+}
+
+ULONG_PTR = ctypes.c_size_t
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("union",)
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+_user32 = None
+
+def _get_user32():
+    """user32 with the prototypes used here, loaded on first call
+    
+    Loading lazily keeps the INPUT builders importable (and testable)
+    off Windows.
+    """
+    global _user32
+    if _user32 is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+        user32.SendInput.restype = wintypes.UINT
+        user32.SetCursorPos.argtypes = (ctypes.c_int, ctypes.c_int)
+        user32.SetCursorPos.restype = wintypes.BOOL
+        user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+        user32.GetSystemMetrics.restype = ctypes.c_int
+        _user32 = user32
+    return _user32
+
+def set_cursor_pos(x, y):
+    """Place the cursor at screen pixel (x, y)"""
+    if not _get_user32().SetCursorPos(x, y):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def mouse_input(flags, dx=0, dy=0):
+    """Build one mouse INPUT event"""
+    return INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dx, dy, 0, flags, 0, 0))
+
+def virtual_screen():
+    """(left, top, width, height) of the desktop spanning every monitor"""
+    user32 = _get_user32()
+    return (
+        user32.GetSystemMetrics(SM_XVIRTUALSCREEN),
+        user32.GetSystemMetrics(SM_YVIRTUALSCREEN),
+        user32.GetSystemMetrics(SM_CXVIRTUALSCREEN),
+        user32.GetSystemMetrics(SM_CYVIRTUALSCREEN),
+    )
+
+def move_input(x, y, screen=None):
+    """Absolute cursor move to screen pixel (x, y) on any monitor
+    
+    Coordinates are normalized to 0..65536 over screen, a virtual_screen()
+    tuple (queried if not given), rounding up so Windows' floor(n * w / 65536)
+    maps back to exactly the requested pixel.
+    """
+    left, top, width, height = screen or virtual_screen()
+    dx = ((x - left) * 65536 + width - 1) // width
+    dy = ((y - top) * 65536 + height - 1) // height
+    return mouse_input(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK, dx, dy)
+
+def click_inputs(button="left", clicks=1):
+    """Down/up pairs for a single or multi-click at the current position"""
+    down, up = BUTTON_FLAGS[button]
+    return [mouse_input(flag) for _ in range(clicks) for flag in (down, up)]
+
+def key_input(vk, flags=0, scan=0):
+    """Build one keyboard INPUT event"""
+    return INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(vk, scan, flags, 0, 0))
+
+def key_press_inputs(key):
+    """Down/up events for a named key or a single character, None if unknown"""
+    vk = VK_CODES.get(key.lower())
+    if vk is not None:
+        return [key_input(vk), key_input(vk, KEYEVENTF_KEYUP)]
+    if len(key) == 1:
+        return unicode_inputs(key)
+    return None
+
+def unicode_inputs(text):
+    """Down/up KEYEVENTF_UNICODE events typing text, layout-independent"""
+    units = text.encode("utf-16-le")
+    inputs = []
+    for i in range(0, len(units), 2):
+        unit = int.from_bytes(units[i:i + 2], "little")
+        inputs.append(key_input(0, KEYEVENTF_UNICODE, unit))
+        inputs.append(key_input(0, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP, unit))
+    return inputs
+
+def text_inputs(text):
+    """Events typing text: control characters as key presses, the rest as Unicode"""
+    inputs = []
+    run_start = 0
+    for i, char in enumerate(text):
+        key = CONTROL_KEYS.get(char)
+        if key is not None:
+            inputs += unicode_inputs(text[run_start:i])
+            inputs += key_press_inputs(key)
+            run_start = i + 1
+    inputs += unicode_inputs(text[run_start:])
+    return inputs
+
+def send_inputs(inputs):
+    """Deliver a batch of INPUT events to the OS in one SendInput call"""
+    count = len(inputs)
+    sent = _get_user32().SendInput(count, (INPUT * count)(*inputs), ctypes.sizeof(INPUT))
+    if sent != count:
+        raise ctypes.WinError(ctypes.get_last_error())
@@ -76,7 +76,7 @@ def interactive_ai_test():
         print("\n2. Taking initial screenshot...")
         screenshot_result = controller.see("initial_app_state_with_chat_interface")
         if screenshot_result and screenshot_result.get('screenshot_path'):
-            screenshot_path = screenshot_result['screenshot_path']
+            screenshot_path = controller.wait_for_screenshot(screenshot_result)
             print(f"   ✅ Screenshot saved: {screenshot_path}")
             print("   📸 I can see the spaceship designer with the new chat interface!")
         
@@ -106,7 +106,7 @@ def interactive_ai_test():
         print("\n5. Taking final screenshot to show interaction...")
         final_screenshot = controller.see("after_mcp_interaction_test")
         if final_screenshot and final_screenshot.get('screenshot_path'):
-            final_path = final_screenshot['screenshot_path']
+            final_path = controller.wait_for_screenshot(final_screenshot)
             print(f"   ✅ Final screenshot: {final_path}")
         
         print("\n6. Testing keyboard interaction...")
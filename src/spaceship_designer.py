@@ -2455,7 +2455,7 @@ class SimplifiedControlPanel(QWidget):
             result = controller.see("testing_mcp_integration_ui")
             
             if result and result.get('screenshot_path'):
-                screenshot_path = result['screenshot_path']
+                screenshot_path = controller.wait_for_screenshot(result)
                 self.log_to_chat(f"AI: Screenshot captured: {screenshot_path}", "ai")
                 self.log_to_chat(f"AI: I can see the spaceship designer app with MCP integration!", "ai")
                 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+UNIT TEST HOOKS
+Shared pytest setup for module test files collected natively by pytest
+
+Qt tests use pytest-qt's qapp/qtbot fixtures: one QApplication per
+worker process, with widgets registered via qtbot.addWidget() torn down
+after each test.
+
+Each test's outcome is also recorded as a TestResult and written to tests/results at session end.
+Under pytest-xdist every worker writes its own results_<worker>.json
+shard (atomically, via os.replace) and the controller merges the shards
+into results.json, so workers never contend for one file. Shards left
+behind by a crashed run are discarded when the next session starts.
+"""
+
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+
+# Headless Qt for every worker: must be set before PyQt6 is first imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false")
+
+import pytest
+
+from test_framework import TestResult, TestLogger, atomic_write_json
+
+RESULTS_DIR = Path(__file__).parent.parent / "results"
+
+_session_logger = TestLogger()
+
+def pytest_sessionstart(session):
+    """Discard worker shards left behind by a crashed run before workers start"""
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        for shard in RESULTS_DIR.glob("results_gw*.json"):
+            shard.unlink()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Record each test's outcome, with its record_property values as details"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" and report.passed:
+        return
+
+    test_result = TestResult(item.name, item.module.__name__)
+    for name, value in item.user_properties:
+        test_result.add_detail(("%s: %s", name, value))
+    status = {"passed": "PASS", "failed": "FAIL", "skipped": "SKIP"}[report.outcome]
+    # Skips carry a (path, lineno, reason) tuple rather than a traceback
+    message = report.longrepr[2] if isinstance(report.longrepr, tuple) else report.longreprtext
+    test_result.complete(status, message)
+    _session_logger.results.append(test_result)
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write this process's results, merging worker shards on the controller"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+
+    if worker:
+        if _session_logger.results:
+            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+            _session_logger.save_results(RESULTS_DIR / f"results_{worker}.json")
+        return
+
+    results = [result.to_dict() for result in _session_logger.results]
+    for shard in sorted(RESULTS_DIR.glob("results_gw*.json")):
+        with open(shard, encoding="utf-8") as f:
+            results.extend(json.load(f)["results"])
+        shard.unlink()
+
+    if not results:
+        return
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    status_counts = {}
+    for result in results:
+        status_counts[result["status"]] = status_counts.get(result["status"], 0) + 1
+
+    # Only the controller (or a plain run) gets here, so no lock is needed
+    atomic_write_json(RESULTS_DIR / "results.json", {
+        "summary": {
+            "total_tests": len(results),
+            "status_counts": status_counts,
+            "pass_rate": status_counts.get("PASS", 0) / len(results) * 100,
+        },
+        "results": results,
+        "timestamp": datetime.now().isoformat(),
+    })
@@ -8,6 +8,7 @@ import sys
 import os
 import time
 import json
+import subprocess
 from pathlib import Path
 from datetime import datetime
 
@@ -16,10 +17,9 @@ current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
 # Import test framework and all test suites
-from test_framework import UniversalTestRunner, DependencyManager
+from test_framework import UniversalTestRunner, DependencyManager, TestResult
 from test_mcp_tools import MCPToolsTestSuite
 from test_ship_generation import ShipGenerationTestSuite
-from test_ui_system import UISystemTestSuite
 from test_display_3d import Display3DTestSuite
 from test_system_integration import SystemIntegrationTestSuite
 
@@ -41,7 +41,6 @@ class MasterTestOrchestrator:
         test_suites = [
             ('MCP Tools', MCPToolsTestSuite("mcp_tools", self.runner.logger)),
             ('Ship Generation', ShipGenerationTestSuite("ship_generation", self.runner.logger)),
-            ('UI System', UISystemTestSuite("ui_system", self.runner.logger)),
             ('3D Display', Display3DTestSuite("display_3d", self.runner.logger)),
             ('System Integration', SystemIntegrationTestSuite("system_integration", self.runner.logger))
         ]
@@ -50,7 +49,9 @@ class MasterTestOrchestrator:
             self.runner.add_test_suite(suite)
             print(f"✅ {name} test suite added")
         
-        print(f"\n📊 Total test suites: {len(test_suites)}")
+        print("✅ UI System test suite added (pytest)")
+        
+        print(f"\n📊 Total test suites: {len(test_suites) + 1}")
         
     def run_comprehensive_tests(self):
         """Run all tests with full dependency management and reporting"""
@@ -77,6 +78,7 @@ class MasterTestOrchestrator:
         print("-" * 40)
         
         results = self.runner.run_all_tests()
+        self.run_pytest_suite('test_ui_system.py', results)
         
         # Phase 3: Results Analysis
         print(f"\n📊 PHASE 3: RESULTS ANALYSIS")
@@ -92,6 +94,47 @@ class MasterTestOrchestrator:
         
         return results
     
+    def run_pytest_suite(self, test_file, results):
+        """Run a native pytest module in a subprocess and fold its results into the report"""
+        
+        print(f"\n🔍 Testing {test_file} (pytest)...")
+        
+        # conftest.py writes each session's outcomes to tests/results/results.json
+        results_file = current_dir.parent / "results" / "results.json"
+        results_file.unlink(missing_ok=True)
+        
+        proc = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", str(current_dir / test_file)],
+            cwd=current_dir, capture_output=True, text=True
+        )
+        
+        logger = self.runner.logger
+        if results_file.exists():
+            with open(results_file, encoding='utf-8') as f:
+                recorded = json.load(f)['results']
+        else:
+            # Collection errors and crashes end the session before any outcome is recorded
+            recorded = [{
+                'test_name': test_file,
+                'module': Path(test_file).stem,
+                'duration': 0.0,
+                'status': 'ERROR',
+                'message': f"pytest exited with code {proc.returncode}",
+                'details': proc.stdout.strip().splitlines()[-10:],
+            }]
+        
+        for entry in recorded:
+            result = TestResult(entry['test_name'], entry['module'])
+            result.duration = entry['duration']
+            result.status = entry['status']
+            result.message = entry['message']
+            result.extend_details(entry['details'])
+            logger.results.append(result)
+            logger.log_test_complete(result)
+            results['results'].append(result)
+        
+        results['summary'] = logger.get_summary()
+    
     def analyze_results(self, results):
         """Analyze test results and provide insights"""
         
@@ -272,7 +315,7 @@ class MasterTestOrchestrator:
                 if result.message:
                     f.write(f"[TEST]     Message: {result.message}\n")
                 
-                for detail in result.details:
+                for detail in result.details_formatted():
                     f.write(f"[TEST]     Detail: {detail}\n")
             
             f.write("[SYSTEM] Comprehensive testing completed\n")
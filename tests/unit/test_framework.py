@@ -9,6 +9,7 @@ import os
 import time
 import traceback
 import json
+import functools
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
@@ -43,9 +44,18 @@ class TestResult:
         self.message = message
         self.exception = exception
         
-    def add_detail(self, detail: str):
-        """Add detail to test result"""
+    def add_detail(self, detail):
+        """Add detail to test result (a string, or a (fmt, *args) tuple formatted lazily)"""
         self.details.append(detail)
+    
+    def extend_details(self, details: List[Any]):
+        """Add a batch of details collected by a test in one call"""
+        self.details.extend(details)
+    
+    def details_formatted(self):
+        """Yield details as strings, formatting deferred (fmt, *args) entries on demand"""
+        for detail in self.details:
+            yield detail if isinstance(detail, str) else detail[0] % detail[1:]
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging"""
@@ -55,7 +65,7 @@ class TestResult:
             'duration': self.duration,
             'status': self.status,
             'message': self.message,
-            'details': self.details,
+            'details': list(self.details_formatted()),
             'exception': str(self.exception) if self.exception else None,
             'timestamp': datetime.now().isoformat()
         }
@@ -100,7 +110,7 @@ class TestLogger:
         print(msg)
         
         # Log details
-        for detail in result.details:
+        for detail in result.details_formatted():
             detail_msg = f"    ℹ️ {detail}"
             self.console_output.append(detail_msg)
             self.app_log_output.append(f"[TEST] {detail_msg}")
@@ -131,8 +141,7 @@ class TestLogger:
             'timestamp': datetime.now().isoformat()
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, indent=2)
+        atomic_write_json(Path(filepath), test_data)
 
 class DependencyManager:
     """Manages and installs dependencies automatically"""
@@ -338,13 +347,28 @@ class UniversalTestRunner:
         print(f"   📋 App log format: {app_log_file}")
 
 # Utility functions for tests
+def atomic_write_json(filepath: Path, data: Any):
+    """Write JSON to a per-process temp file, then os.replace() it into place
+
+    Readers (and concurrent xdist workers) only ever see a complete file.
+    """
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, filepath)
+
 def assert_module_function_exists(module, function_name: str):
     """Assert that a module has a specific function"""
     assert hasattr(module, function_name), f"Module missing function: {function_name}"
 
+@functools.lru_cache(maxsize=None)
+def class_has_method(cls, method_name: str) -> bool:
+    """Check (and memoize) whether a class has a specific method"""
+    return hasattr(cls, method_name)
+
 def assert_class_has_method(cls, method_name: str):
     """Assert that a class has a specific method"""
-    assert hasattr(cls, method_name), f"Class {cls.__name__} missing method: {method_name}"
+    assert class_has_method(cls, method_name), f"Class {cls.__name__} missing method: {method_name}"
 
 def assert_instance_created(factory_func: Callable, expected_type: type = None):
     """Assert that a factory function creates an instance"""
@@ -4,14 +4,19 @@ SYSTEM INTEGRATION MODULE UNIT TESTS
 Comprehensive testing for integration layer and event bus system
 """
 
-import sys
 import time
-import threading
+import collections
+import reprlib
 from pathlib import Path
 
 # Import test framework
 from test_framework import ModuleTestSuite, TestResult, assert_module_function_exists, assert_class_has_method, assert_instance_created
 
+# Bounded repr for logging responses without stringifying them in full
+_REPR = reprlib.Repr()
+_REPR.maxstring = 100
+_REPR.maxother = 100
+
 class SystemIntegrationTestSuite(ModuleTestSuite):
     """Complete test suite for system integration module"""
     
@@ -19,496 +24,570 @@ class SystemIntegrationTestSuite(ModuleTestSuite):
         """Setup specific to system integration testing"""
         self.test_systems = []
         self.test_events = []
-        self.event_handlers_called = []
+        self.event_handlers_called = collections.deque(maxlen=1024)
+    
+    def _make_designer(self):
+        """Create and initialize a designer for tests that only need one as setup"""
+        designer = self.module.IntegratedSpaceshipDesigner()
+        try:
+            designer.initialize_system()
+        except Exception:
+            pass  # Initialization problems are reported by test_integrated_spaceship_designer_creation
+        
+        self.test_systems.append(designer)
+        return designer
+    
+    def _make_event_bus(self):
+        """Create an event bus for tests that only need one as setup"""
+        return self.module.SystemEventBus()
         
     def test_module_imports(self, result: TestResult):
         """Test that all required classes and functions can be imported"""
-        
-        # Check main classes exist
-        assert_class_has_method(self.module.IntegratedSpaceshipDesigner, '__init__')
-        assert_class_has_method(self.module.ModuleRegistry, '__init__')
-        assert_class_has_method(self.module.SystemEventBus, '__init__')
-        result.add_detail("All main classes importable")
-        
-        # Check integration methods
-        assert_class_has_method(self.module.IntegratedSpaceshipDesigner, 'initialize_system')
-        assert_class_has_method(self.module.IntegratedSpaceshipDesigner, 'start_application')
-        assert_class_has_method(self.module.IntegratedSpaceshipDesigner, 'shutdown_system')
-        result.add_detail("IntegratedSpaceshipDesigner has required methods")
-        
-        # Check registry methods
-        assert_class_has_method(self.module.ModuleRegistry, 'register_module')
-        assert_class_has_method(self.module.ModuleRegistry, 'get_module')
-        assert_class_has_method(self.module.ModuleRegistry, 'unregister_module')
-        result.add_detail("ModuleRegistry has required methods")
-        
-        # Check event bus methods
-        assert_class_has_method(self.module.SystemEventBus, 'subscribe')
-        assert_class_has_method(self.module.SystemEventBus, 'publish')
-        assert_class_has_method(self.module.SystemEventBus, 'unsubscribe')
-        result.add_detail("SystemEventBus has required methods")
+        details = []
+        try:
+            mod = self.module
+            Designer = mod.IntegratedSpaceshipDesigner
+            Registry = mod.ModuleRegistry
+            Bus = mod.SystemEventBus
+        
+            # Check main classes exist
+            assert_class_has_method(Designer, '__init__')
+            assert_class_has_method(Registry, '__init__')
+            assert_class_has_method(Bus, '__init__')
+            details.append("All main classes importable")
+        
+            # Check integration methods
+            assert_class_has_method(Designer, 'initialize_system')
+            assert_class_has_method(Designer, 'start_application')
+            assert_class_has_method(Designer, 'shutdown_system')
+            details.append("IntegratedSpaceshipDesigner has required methods")
+        
+            # Check registry methods
+            assert_class_has_method(Registry, 'register_module')
+            assert_class_has_method(Registry, 'get_module')
+            assert_class_has_method(Registry, 'unregister_module')
+            details.append("ModuleRegistry has required methods")
+        
+            # Check event bus methods
+            assert_class_has_method(Bus, 'subscribe')
+            assert_class_has_method(Bus, 'publish')
+            assert_class_has_method(Bus, 'unsubscribe')
+            details.append("SystemEventBus has required methods")
+        finally:
+            result.extend_details(details)
     
     def test_integrated_spaceship_designer_creation(self, result: TestResult):
         """Test integrated system can be created and configured"""
-        
-        # Create integrated designer instance
-        designer = assert_instance_created(
-            lambda: self.module.IntegratedSpaceshipDesigner(),
-            self.module.IntegratedSpaceshipDesigner
-        )
-        result.add_detail("IntegratedSpaceshipDesigner created successfully")
-        
-        # Check designer attributes
-        required_attrs = ['module_registry', 'event_bus', 'modules', 'initialized']
-        for attr in required_attrs:
-            if hasattr(designer, attr):
-                result.add_detail(f"Designer has {attr}")
-        
-        # Test system initialization
+        details = []
         try:
-            designer.initialize_system()
-            result.add_detail("System initialization completed")
+            Designer = self.module.IntegratedSpaceshipDesigner
+        
+            # Create integrated designer instance
+            designer = assert_instance_created(
+                lambda: Designer(),
+                Designer
+            )
+            details.append("IntegratedSpaceshipDesigner created successfully")
+        
+            # Check designer attributes
+            required_attrs = ['module_registry', 'event_bus', 'modules', 'initialized']
+            for attr in required_attrs:
+                if hasattr(designer, attr):
+                    details.append(("Designer has %s", attr))
+        
+            # Test system initialization
+            try:
+                designer.initialize_system()
+                details.append("System initialization completed")
             
-            # Check if modules were loaded
-            if hasattr(designer, 'modules'):
-                modules = getattr(designer, 'modules', {})
-                result.add_detail(f"Loaded modules: {list(modules.keys())}")
+                # Check if modules were loaded
+                if hasattr(designer, 'modules'):
+                    modules = getattr(designer, 'modules', {})
+                    details.append(f"Loaded modules: {list(modules.keys())}")
                 
-        except Exception as e:
-            result.add_detail(f"System initialization error: {str(e)}")
+            except Exception as e:
+                details.append(f"System initialization error: {str(e)}")
         
-        self.test_systems.append(designer)
-        return designer
+            self.test_systems.append(designer)
+            return designer
+        finally:
+            result.extend_details(details)
     
     def test_module_registry(self, result: TestResult):
         """Test module registry functionality"""
+        details = []
+        try:
+            Registry = self.module.ModuleRegistry
         
-        # Create module registry
-        registry = assert_instance_created(
-            lambda: self.module.ModuleRegistry(),
-            self.module.ModuleRegistry
-        )
-        result.add_detail("ModuleRegistry created successfully")
+            # Create module registry
+            registry = assert_instance_created(
+                lambda: Registry(),
+                Registry
+            )
+            details.append("ModuleRegistry created successfully")
         
-        # Test module registration
-        try:
-            # Create mock modules
-            mock_modules = {
-                'ui_system': {'name': 'UI System', 'status': 'active'},
-                'ship_generation': {'name': 'Ship Generator', 'status': 'active'},
-                'mcp_tools': {'name': 'MCP Tools', 'status': 'standby'}
-            }
+            # Test module registration
+            try:
+                # Create mock modules
+                mock_modules = {
+                    'ui_system': {'name': 'UI System', 'status': 'active'},
+                    'ship_generation': {'name': 'Ship Generator', 'status': 'active'},
+                    'mcp_tools': {'name': 'MCP Tools', 'status': 'standby'}
+                }
             
-            # Register modules
-            for name, module in mock_modules.items():
-                registry.register_module(name, module)
-                result.add_detail(f"Module registered: {name}")
+                # Register modules
+                for name, module in mock_modules.items():
+                    registry.register_module(name, module)
+                    details.append(("Module registered: %s", name))
             
-            # Test module retrieval
-            for name in mock_modules:
-                retrieved = registry.get_module(name)
-                assert retrieved is not None, f"Failed to retrieve module: {name}"
-                result.add_detail(f"Module retrieved: {name}")
+                # Test module retrieval
+                for name in mock_modules:
+                    retrieved = registry.get_module(name)
+                    assert retrieved is not None, f"Failed to retrieve module: {name}"
+                    details.append(("Module retrieved: %s", name))
             
-            # Test module listing
-            if hasattr(registry, 'list_modules'):
-                modules = registry.list_modules()
-                result.add_detail(f"Total modules registered: {len(modules)}")
+                # Test module listing
+                if hasattr(registry, 'list_modules'):
+                    modules = registry.list_modules()
+                    details.append(f"Total modules registered: {len(modules)}")
                 
-        except Exception as e:
-            result.add_detail(f"Module registry error: {str(e)}")
+            except Exception as e:
+                details.append(f"Module registry error: {str(e)}")
         
-        # Test module unregistration
-        try:
-            registry.unregister_module('mcp_tools')
-            result.add_detail("Module unregistered successfully")
+            # Test module unregistration
+            try:
+                registry.unregister_module('mcp_tools')
+                details.append("Module unregistered successfully")
             
-            # Verify removal
-            removed = registry.get_module('mcp_tools')
-            assert removed is None, "Module not properly unregistered"
-            result.add_detail("Module removal verified")
+                # Verify removal
+                removed = registry.get_module('mcp_tools')
+                assert removed is None, "Module not properly unregistered"
+                details.append("Module removal verified")
             
-        except Exception as e:
-            result.add_detail(f"Module unregistration error: {str(e)}")
+            except Exception as e:
+                details.append(f"Module unregistration error: {str(e)}")
         
-        return registry
+            return registry
+        finally:
+            result.extend_details(details)
     
     def test_system_event_bus(self, result: TestResult):
         """Test system event bus functionality"""
+        details = []
+        try:
+            Bus = self.module.SystemEventBus
         
-        # Create event bus
-        event_bus = assert_instance_created(
-            lambda: self.module.SystemEventBus(),
-            self.module.SystemEventBus
-        )
-        result.add_detail("SystemEventBus created successfully")
+            # Create event bus
+            event_bus = assert_instance_created(
+                lambda: Bus(),
+                Bus
+            )
+            details.append("SystemEventBus created successfully")
         
-        # Test event subscription and publishing
-        def test_event_handler(event_data):
-            self.event_handlers_called.append(event_data)
-            return f"Handled: {event_data.get('type', 'unknown')}"
+            # Test event subscription and publishing
+            def test_event_handler(event_data):
+                self.event_handlers_called.append(event_data)
+                return f"Handled: {event_data.get('type', 'unknown')}"
         
-        try:
-            # Subscribe to events
-            event_bus.subscribe('ship_generated', test_event_handler)
-            event_bus.subscribe('ui_updated', test_event_handler)
-            result.add_detail("Event handlers subscribed")
+            try:
+                # Subscribe to events
+                event_bus.subscribe('ship_generated', test_event_handler)
+                event_bus.subscribe('ui_updated', test_event_handler)
+                details.append("Event handlers subscribed")
             
-            # Publish events
-            test_events = [
-                {'type': 'ship_generated', 'data': {'vertices': 100, 'faces': 200}},
-                {'type': 'ui_updated', 'data': {'component': 'status_bar'}},
-                {'type': 'system_ready', 'data': {'timestamp': time.time()}}
-            ]
+                # Publish events
+                test_events = [
+                    {'type': 'ship_generated', 'data': {'vertices': 100, 'faces': 200}},
+                    {'type': 'ui_updated', 'data': {'component': 'status_bar'}},
+                    {'type': 'system_ready', 'data': {'timestamp': time.time()}}
+                ]
             
-            for event in test_events:
-                event_bus.publish(event['type'], event['data'])
-                result.add_detail(f"Event published: {event['type']}")
-                self.test_events.append(event)
+                for event in test_events:
+                    event_bus.publish(event['type'], event['data'])
+                    details.append(("Event published: %s", event['type']))
+                    self.test_events.append(event)
             
-            # Verify handlers were called
-            time.sleep(0.1)  # Allow async processing
-            if self.event_handlers_called:
-                result.add_detail(f"Event handlers called: {len(self.event_handlers_called)} times")
+                # Verify handlers were called
+                time.sleep(0.1)  # Allow async processing
+                if self.event_handlers_called:
+                    details.append(f"Event handlers called: {len(self.event_handlers_called)} times")
             
-        except Exception as e:
-            result.add_detail(f"Event bus error: {str(e)}")
+            except Exception as e:
+                details.append(f"Event bus error: {str(e)}")
         
-        # Test event unsubscription
-        try:
-            event_bus.unsubscribe('ship_generated', test_event_handler)
-            result.add_detail("Event handler unsubscribed")
+            # Test event unsubscription
+            try:
+                event_bus.unsubscribe('ship_generated', test_event_handler)
+                details.append("Event handler unsubscribed")
             
-        except Exception as e:
-            result.add_detail(f"Unsubscription error: {str(e)}")
+            except Exception as e:
+                details.append(f"Unsubscription error: {str(e)}")
         
-        return event_bus
+            return event_bus
+        finally:
+            result.extend_details(details)
     
     def test_module_lifecycle_management(self, result: TestResult):
         """Test module lifecycle and dependency management"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
-        
-        # Test module startup sequence
-        if hasattr(designer, 'start_modules'):
-            try:
-                startup_order = designer.start_modules()
-                result.add_detail(f"Module startup order: {startup_order}")
-            except Exception as e:
-                result.add_detail(f"Module startup error: {str(e)}")
-        
-        # Test module dependency resolution
-        if hasattr(designer, 'resolve_dependencies'):
-            try:
-                dependencies = {
-                    'ui_system': ['display_3d'],
-                    'ship_generation': ['mcp_tools'],
-                    'display_3d': [],
-                    'mcp_tools': []
-                }
+            designer = self._make_designer()
+        
+            # Test module startup sequence
+            if hasattr(designer, 'start_modules'):
+                try:
+                    startup_order = designer.start_modules()
+                    details.append(f"Module startup order: {startup_order}")
+                except Exception as e:
+                    details.append(f"Module startup error: {str(e)}")
+        
+            # Test module dependency resolution
+            if hasattr(designer, 'resolve_dependencies'):
+                try:
+                    dependencies = {
+                        'ui_system': ['display_3d'],
+                        'ship_generation': ['mcp_tools'],
+                        'display_3d': [],
+                        'mcp_tools': []
+                    }
                 
-                resolved = designer.resolve_dependencies(dependencies)
-                result.add_detail(f"Dependencies resolved: {resolved}")
+                    resolved = designer.resolve_dependencies(dependencies)
+                    details.append(f"Dependencies resolved: {resolved}")
                 
-            except Exception as e:
-                result.add_detail(f"Dependency resolution error: {str(e)}")
-        
-        # Test module health monitoring
-        if hasattr(designer, 'check_module_health'):
-            try:
-                health_status = designer.check_module_health()
-                result.add_detail(f"Module health check: {health_status}")
-            except Exception as e:
-                result.add_detail(f"Health check error: {str(e)}")
+                except Exception as e:
+                    details.append(f"Dependency resolution error: {str(e)}")
+        
+            # Test module health monitoring
+            if hasattr(designer, 'check_module_health'):
+                try:
+                    health_status = designer.check_module_health()
+                    details.append(f"Module health check: {health_status}")
+                except Exception as e:
+                    details.append(f"Health check error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_inter_module_communication(self, result: TestResult):
         """Test communication between modules"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
-        event_bus = self.test_system_event_bus(TestResult("bus_setup", "system_integration"))
-        
-        # Test cross-module function calls
-        if hasattr(designer, 'call_module_function'):
-            try:
-                # Simulate UI requesting ship generation
-                request = {
-                    'source_module': 'ui_system',
-                    'target_module': 'ship_generation',
-                    'function': 'generate_ship',
-                    'parameters': {'ship_type': 'fighter'}
-                }
+            designer = self._make_designer()
+            event_bus = self._make_event_bus()
+        
+            # Test cross-module function calls
+            if hasattr(designer, 'call_module_function'):
+                try:
+                    # Simulate UI requesting ship generation
+                    request = {
+                        'source_module': 'ui_system',
+                        'target_module': 'ship_generation',
+                        'function': 'generate_ship',
+                        'parameters': {'ship_type': 'fighter'}
+                    }
                 
-                response = designer.call_module_function(request)
-                result.add_detail("Cross-module function call completed")
+                    response = designer.call_module_function(request)
+                    details.append("Cross-module function call completed")
                 
-                if response:
-                    result.add_detail(f"Response received: {str(response)[:100]}")
+                    if response:
+                        details.append(f"Response received: {_REPR.repr(response)}")
                     
-            except Exception as e:
-                result.add_detail(f"Cross-module call error: {str(e)}")
-        
-        # Test data sharing between modules
-        if hasattr(designer, 'share_data'):
-            try:
-                shared_data = {
-                    'current_ship': {'id': 'ship_001', 'type': 'cruiser'},
-                    'render_settings': {'wireframe': False, 'lighting': True}
-                }
+                except Exception as e:
+                    details.append(f"Cross-module call error: {str(e)}")
+        
+            # Test data sharing between modules
+            if hasattr(designer, 'share_data'):
+                try:
+                    shared_data = {
+                        'current_ship': {'id': 'ship_001', 'type': 'cruiser'},
+                        'render_settings': {'wireframe': False, 'lighting': True}
+                    }
                 
-                designer.share_data('global_state', shared_data)
-                result.add_detail("Data shared between modules")
+                    designer.share_data('global_state', shared_data)
+                    details.append("Data shared between modules")
                 
-                # Retrieve shared data
-                retrieved = designer.get_shared_data('global_state')
-                if retrieved:
-                    result.add_detail("Shared data retrieved successfully")
+                    # Retrieve shared data
+                    retrieved = designer.get_shared_data('global_state')
+                    if retrieved:
+                        details.append("Shared data retrieved successfully")
                     
-            except Exception as e:
-                result.add_detail(f"Data sharing error: {str(e)}")
+                except Exception as e:
+                    details.append(f"Data sharing error: {str(e)}")
         
-        # Test event-driven communication
-        communication_events = []
+            # Test event-driven communication
+            communication_events = collections.deque()
         
-        def communication_handler(event_data):
-            communication_events.append(event_data)
+            def communication_handler(event_data):
+                communication_events.append(event_data)
         
-        try:
-            event_bus.subscribe('module_communication', communication_handler)
+            try:
+                event_bus.subscribe('module_communication', communication_handler)
             
-            # Simulate module communication events
-            comm_events = [
-                {'from': 'ui_system', 'to': 'ship_generation', 'action': 'generate'},
-                {'from': 'ship_generation', 'to': 'display_3d', 'action': 'render'},
-                {'from': 'display_3d', 'to': 'ui_system', 'action': 'update_status'}
-            ]
+                # Simulate module communication events
+                comm_events = [
+                    {'from': 'ui_system', 'to': 'ship_generation', 'action': 'generate'},
+                    {'from': 'ship_generation', 'to': 'display_3d', 'action': 'render'},
+                    {'from': 'display_3d', 'to': 'ui_system', 'action': 'update_status'}
+                ]
             
-            for comm_event in comm_events:
-                event_bus.publish('module_communication', comm_event)
-                result.add_detail(f"Communication event: {comm_event['from']} -> {comm_event['to']}")
+                for comm_event in comm_events:
+                    event_bus.publish('module_communication', comm_event)
+                    details.append(("Communication event: %s -> %s", comm_event['from'], comm_event['to']))
             
-            time.sleep(0.1)  # Allow processing
-            result.add_detail(f"Communication events processed: {len(communication_events)}")
+                time.sleep(0.1)  # Allow processing
+                details.append(f"Communication events processed: {len(communication_events)}")
             
-        except Exception as e:
-            result.add_detail(f"Event communication error: {str(e)}")
+            except Exception as e:
+                details.append(f"Event communication error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_error_propagation_and_handling(self, result: TestResult):
         """Test error propagation and system-wide error handling"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
-        
-        # Test error propagation
-        if hasattr(designer, 'handle_module_error'):
-            try:
-                # Simulate module errors
-                test_errors = [
-                    {'module': 'ship_generation', 'error': 'mesh_creation_failed', 'severity': 'warning'},
-                    {'module': 'display_3d', 'error': 'opengl_context_lost', 'severity': 'error'},
-                    {'module': 'mcp_tools', 'error': 'connection_timeout', 'severity': 'info'}
-                ]
-                
-                for error in test_errors:
-                    handled = designer.handle_module_error(error)
-                    result.add_detail(f"Error handled: {error['module']} - {error['error']}")
-                    
-            except Exception as e:
-                result.add_detail(f"Error handling test error: {str(e)}")
+            designer = self._make_designer()
         
-        # Test system recovery
-        if hasattr(designer, 'recover_from_error'):
-            try:
-                recovery_success = designer.recover_from_error('display_3d', 'opengl_context_lost')
-                result.add_detail(f"System recovery attempted: {recovery_success}")
-            except Exception as e:
-                result.add_detail(f"Recovery test error: {str(e)}")
+            # Simulate module errors
+            test_errors = [
+                {'module': 'ship_generation', 'error': 'mesh_creation_failed', 'severity': 'warning'},
+                {'module': 'display_3d', 'error': 'opengl_context_lost', 'severity': 'error'},
+                {'module': 'mcp_tools', 'error': 'connection_timeout', 'severity': 'info'}
+            ]
         
-        # Test graceful degradation
-        if hasattr(designer, 'enable_degraded_mode'):
-            try:
-                designer.enable_degraded_mode(['display_3d'])
-                result.add_detail("Degraded mode enabled for display_3d")
-            except Exception as e:
-                result.add_detail(f"Degraded mode error: {str(e)}")
+            # Test error propagation (batched when the designer supports it)
+            if hasattr(designer, 'handle_module_errors') or hasattr(designer, 'handle_module_error'):
+                handled_errors = []
+                try:
+                    if hasattr(designer, 'handle_module_errors'):
+                        designer.handle_module_errors(test_errors)
+                        handled_errors.extend(test_errors)
+                    else:
+                        for error in test_errors:
+                            designer.handle_module_error(error)
+                            handled_errors.append(error)
+                    
+                except Exception as e:
+                    details.append(f"Error handling test error: {str(e)}")
+            
+                if handled_errors:
+                    details.append(("Errors handled: %s", ", ".join(
+                        f"{error['module']} - {error['error']}" for error in handled_errors
+                    )))
+        
+            # Test system recovery
+            if hasattr(designer, 'recover_from_error'):
+                try:
+                    recovery_success = designer.recover_from_error('display_3d', 'opengl_context_lost')
+                    details.append(f"System recovery attempted: {recovery_success}")
+                except Exception as e:
+                    details.append(f"Recovery test error: {str(e)}")
+        
+            # Test graceful degradation
+            if hasattr(designer, 'enable_degraded_mode'):
+                try:
+                    designer.enable_degraded_mode(['display_3d'])
+                    details.append("Degraded mode enabled for display_3d")
+                except Exception as e:
+                    details.append(f"Degraded mode error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_performance_monitoring(self, result: TestResult):
         """Test system performance monitoring and metrics"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
+            designer = self._make_designer()
         
-        # Test performance metrics collection
-        if hasattr(designer, 'collect_performance_metrics'):
-            try:
-                start_time = time.time()
+            # Test performance metrics collection
+            if hasattr(designer, 'collect_performance_metrics'):
+                try:
+                    start_time = time.time()
                 
-                # Simulate system activity
-                for i in range(10):
+                    # Simulate system activity
                     if hasattr(designer, 'simulate_activity'):
                         designer.simulate_activity()
-                    time.sleep(0.01)
-                
-                metrics = designer.collect_performance_metrics()
-                total_time = time.time() - start_time
+
+                    metrics = designer.collect_performance_metrics()
+                    total_time = time.time() - start_time
                 
-                result.add_detail(f"Performance test completed in {total_time:.3f}s")
+                    details.append(f"Performance test completed in {total_time:.3f}s")
                 
-                if metrics:
-                    result.add_detail(f"Metrics collected: {list(metrics.keys())}")
+                    if metrics:
+                        details.append(f"Metrics collected: {list(metrics.keys())}")
                     
-            except Exception as e:
-                result.add_detail(f"Performance monitoring error: {str(e)}")
-        
-        # Test resource usage monitoring
-        if hasattr(designer, 'monitor_resources'):
-            try:
-                resource_usage = designer.monitor_resources()
-                if resource_usage:
-                    for resource, value in resource_usage.items():
-                        result.add_detail(f"Resource {resource}: {value}")
-            except Exception as e:
-                result.add_detail(f"Resource monitoring error: {str(e)}")
-        
-        # Test bottleneck detection
-        if hasattr(designer, 'detect_bottlenecks'):
-            try:
-                bottlenecks = designer.detect_bottlenecks()
-                if bottlenecks:
-                    result.add_detail(f"Bottlenecks detected: {bottlenecks}")
-                else:
-                    result.add_detail("No bottlenecks detected")
-            except Exception as e:
-                result.add_detail(f"Bottleneck detection error: {str(e)}")
+                except Exception as e:
+                    details.append(f"Performance monitoring error: {str(e)}")
+        
+            # Test resource usage monitoring
+            if hasattr(designer, 'monitor_resources'):
+                try:
+                    resource_usage = designer.monitor_resources()
+                    if resource_usage:
+                        for resource, value in resource_usage.items():
+                            details.append(("Resource %s: %s", resource, value))
+                except Exception as e:
+                    details.append(f"Resource monitoring error: {str(e)}")
+        
+            # Test bottleneck detection
+            if hasattr(designer, 'detect_bottlenecks'):
+                try:
+                    bottlenecks = designer.detect_bottlenecks()
+                    if bottlenecks:
+                        details.append(f"Bottlenecks detected: {bottlenecks}")
+                    else:
+                        details.append("No bottlenecks detected")
+                except Exception as e:
+                    details.append(f"Bottleneck detection error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_configuration_management(self, result: TestResult):
         """Test system configuration and settings management"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
+            designer = self._make_designer()
         
-        # Test configuration loading
-        if hasattr(designer, 'load_configuration'):
-            try:
-                config = designer.load_configuration()
-                if config:
-                    result.add_detail(f"Configuration loaded: {len(config)} settings")
+            # Test configuration loading
+            if hasattr(designer, 'load_configuration'):
+                try:
+                    config = designer.load_configuration()
+                    if config:
+                        details.append(f"Configuration loaded: {len(config)} settings")
                     
-                    # Check for expected configuration sections
-                    expected_sections = ['ui_settings', 'render_settings', 'generation_settings']
-                    for section in expected_sections:
-                        if section in config:
-                            result.add_detail(f"Configuration section found: {section}")
+                        # Check for expected configuration sections
+                        expected_sections = ['ui_settings', 'render_settings', 'generation_settings']
+                        for section in expected_sections:
+                            if section in config:
+                                details.append(("Configuration section found: %s", section))
                             
-            except Exception as e:
-                result.add_detail(f"Configuration loading error: {str(e)}")
-        
-        # Test configuration updates
-        if hasattr(designer, 'update_configuration'):
-            try:
-                test_updates = {
-                    'ui_settings': {'theme': 'dark', 'window_size': [1200, 800]},
-                    'render_settings': {'wireframe': False, 'lighting': True},
-                    'generation_settings': {'default_ship_type': 'fighter'}
-                }
+                except Exception as e:
+                    details.append(f"Configuration loading error: {str(e)}")
+        
+            # Test configuration updates
+            if hasattr(designer, 'update_configuration'):
+                try:
+                    test_updates = {
+                        'ui_settings': {'theme': 'dark', 'window_size': [1200, 800]},
+                        'render_settings': {'wireframe': False, 'lighting': True},
+                        'generation_settings': {'default_ship_type': 'fighter'}
+                    }
                 
-                for section, settings in test_updates.items():
-                    designer.update_configuration(section, settings)
-                    result.add_detail(f"Configuration updated: {section}")
+                    for section, settings in test_updates.items():
+                        designer.update_configuration(section, settings)
+                        details.append(("Configuration updated: %s", section))
                     
-            except Exception as e:
-                result.add_detail(f"Configuration update error: {str(e)}")
-        
-        # Test configuration persistence
-        if hasattr(designer, 'save_configuration'):
-            try:
-                save_success = designer.save_configuration()
-                result.add_detail(f"Configuration saved: {save_success}")
-            except Exception as e:
-                result.add_detail(f"Configuration save error: {str(e)}")
+                except Exception as e:
+                    details.append(f"Configuration update error: {str(e)}")
+        
+            # Test configuration persistence
+            if hasattr(designer, 'save_configuration'):
+                try:
+                    save_success = designer.save_configuration()
+                    details.append(f"Configuration saved: {save_success}")
+                except Exception as e:
+                    details.append(f"Configuration save error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_plugin_system(self, result: TestResult):
         """Test plugin system and extensibility"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
-        
-        # Test plugin registration
-        if hasattr(designer, 'register_plugin'):
-            try:
-                # Create mock plugins
-                mock_plugins = [
-                    {'name': 'advanced_renderer', 'version': '1.0', 'type': 'display'},
-                    {'name': 'ship_exporter', 'version': '2.1', 'type': 'utility'},
-                    {'name': 'ai_assistant', 'version': '1.5', 'type': 'automation'}
-                ]
+            designer = self._make_designer()
+        
+            # Test plugin registration
+            if hasattr(designer, 'register_plugin'):
+                try:
+                    # Create mock plugins
+                    mock_plugins = [
+                        {'name': 'advanced_renderer', 'version': '1.0', 'type': 'display'},
+                        {'name': 'ship_exporter', 'version': '2.1', 'type': 'utility'},
+                        {'name': 'ai_assistant', 'version': '1.5', 'type': 'automation'}
+                    ]
                 
-                for plugin in mock_plugins:
-                    designer.register_plugin(plugin['name'], plugin)
-                    result.add_detail(f"Plugin registered: {plugin['name']} v{plugin['version']}")
+                    for plugin in mock_plugins:
+                        designer.register_plugin(plugin['name'], plugin)
+                        details.append(("Plugin registered: %s v%s", plugin['name'], plugin['version']))
                     
-            except Exception as e:
-                result.add_detail(f"Plugin registration error: {str(e)}")
-        
-        # Test plugin loading and activation
-        if hasattr(designer, 'load_plugins'):
-            try:
-                loaded_plugins = designer.load_plugins()
-                result.add_detail(f"Plugins loaded: {len(loaded_plugins) if loaded_plugins else 0}")
-            except Exception as e:
-                result.add_detail(f"Plugin loading error: {str(e)}")
-        
-        # Test plugin hooks and extensions
-        if hasattr(designer, 'execute_plugin_hooks'):
-            try:
-                hook_results = designer.execute_plugin_hooks('before_ship_generation')
-                result.add_detail(f"Plugin hooks executed: {len(hook_results) if hook_results else 0}")
-            except Exception as e:
-                result.add_detail(f"Plugin hooks error: {str(e)}")
+                except Exception as e:
+                    details.append(f"Plugin registration error: {str(e)}")
+        
+            # Test plugin loading and activation
+            if hasattr(designer, 'load_plugins'):
+                try:
+                    loaded_plugins = designer.load_plugins()
+                    details.append(f"Plugins loaded: {len(loaded_plugins) if loaded_plugins else 0}")
+                except Exception as e:
+                    details.append(f"Plugin loading error: {str(e)}")
+        
+            # Test plugin hooks and extensions
+            if hasattr(designer, 'execute_plugin_hooks'):
+                try:
+                    hook_results = designer.execute_plugin_hooks('before_ship_generation')
+                    details.append(f"Plugin hooks executed: {len(hook_results) if hook_results else 0}")
+                except Exception as e:
+                    details.append(f"Plugin hooks error: {str(e)}")
+        finally:
+            result.extend_details(details)
     
     def test_system_shutdown_and_cleanup(self, result: TestResult):
         """Test system shutdown and resource cleanup"""
+        details = []
+        try:
         
-        designer = self.test_integrated_spaceship_designer_creation(TestResult("designer_setup", "system_integration"))
+            designer = self._make_designer()
         
-        # Test graceful shutdown
-        if hasattr(designer, 'shutdown_system'):
-            try:
-                shutdown_success = designer.shutdown_system()
-                result.add_detail(f"System shutdown initiated: {shutdown_success}")
+            # Test graceful shutdown
+            if hasattr(designer, 'shutdown_system'):
+                try:
+                    shutdown_success = designer.shutdown_system()
+                    details.append(f"System shutdown initiated: {shutdown_success}")
                 
-                # Check if modules were properly closed
-                if hasattr(designer, 'modules'):
-                    modules = getattr(designer, 'modules', {})
-                    for name, module in modules.items():
-                        if hasattr(module, 'status'):
-                            status = getattr(module, 'status', 'unknown')
-                            result.add_detail(f"Module {name} status: {status}")
+                    # Check if modules were properly closed
+                    if hasattr(designer, 'modules'):
+                        modules = getattr(designer, 'modules', {})
+                        for name, module in modules.items():
+                            if hasattr(module, 'status'):
+                                status = getattr(module, 'status', 'unknown')
+                                details.append(("Module %s status: %s", name, status))
                             
-            except Exception as e:
-                result.add_detail(f"Shutdown error: {str(e)}")
-        
-        # Test resource cleanup
-        if hasattr(designer, 'cleanup_resources'):
-            try:
-                cleanup_report = designer.cleanup_resources()
-                if cleanup_report:
-                    result.add_detail(f"Resources cleaned: {cleanup_report}")
-                else:
-                    result.add_detail("Resource cleanup completed")
-            except Exception as e:
-                result.add_detail(f"Cleanup error: {str(e)}")
-        
-        # Test memory cleanup verification
-        import gc
-        initial_objects = len(gc.get_objects())
-        
-        # Clear test system references
-        self.test_systems.clear()
-        gc.collect()
-        
-        final_objects = len(gc.get_objects())
-        object_difference = final_objects - initial_objects
-        
-        if abs(object_difference) < 100:  # Reasonable threshold
-            result.add_detail("Memory cleanup successful")
-        else:
-            result.add_detail(f"Potential memory leak: {object_difference} objects")
+                except Exception as e:
+                    details.append(f"Shutdown error: {str(e)}")
+        
+            # Test resource cleanup
+            if hasattr(designer, 'cleanup_resources'):
+                try:
+                    cleanup_report = designer.cleanup_resources()
+                    if cleanup_report:
+                        details.append(f"Resources cleaned: {cleanup_report}")
+                    else:
+                        details.append("Resource cleanup completed")
+                except Exception as e:
+                    details.append(f"Cleanup error: {str(e)}")
+        
+            # Test memory cleanup verification
+            import gc
+            initial_objects = len(gc.get_objects())
+        
+            # Clear test system references
+            self.test_systems.clear()
+            gc.collect()
+        
+            final_objects = len(gc.get_objects())
+            object_difference = final_objects - initial_objects
+        
+            if abs(object_difference) < 100:  # Reasonable threshold
+                details.append("Memory cleanup successful")
+            else:
+                details.append(f"Potential memory leak: {object_difference} objects")
+        finally:
+            result.extend_details(details)
 
 if __name__ == "__main__":
     from test_framework import UniversalTestRunner
@@ -516,14 +595,14 @@ if __name__ == "__main__":
     # Create test runner
     runner = UniversalTestRunner()
     
-    # Add system integration test suite
-    integration_suite = SystemIntegrationTestSuite("system_integration", runner.logger)
-    runner.add_test_suite(integration_suite)
-    
     # Run dependency check
     deps_ok = runner.run_dependency_check()
     
     if deps_ok:
+        # Add system integration test suite
+        integration_suite = SystemIntegrationTestSuite("system_integration", runner.logger)
+        runner.add_test_suite(integration_suite)
+        
         # Run tests
         results = runner.run_all_tests()
         
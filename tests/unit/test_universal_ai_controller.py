@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+UNIVERSAL AI CONTROLLER UNIT TESTS
+Platform-independent helpers of the Windows-only AI controller
+
+The GUI modules are imported lazily by the controller's constructor, so
+these tests build instances without it and only exercise pure logic.
+"""
+
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+# The controller lives at the repository root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import universal_ai_controller as uac
+
+@pytest.fixture
+def controller():
+    """A controller instance that skips __init__ (and its Windows imports)"""
+    instance = object.__new__(uac.UniversalAIController)
+    instance._ts_second = None
+    instance._ts_prefix = ""
+    return instance
+
+def make_session(controller, session_dir, session_id="20250101_120000"):
+    """Give a bare controller the state its action log needs"""
+    controller.session_dir = session_dir
+    controller.session_id = session_id
+    controller.actions_file = session_dir / f"actions_{session_id}.jsonl"
+    controller.frames_file = session_dir / f"frames_{session_id}.bin"
+    controller.session_log = []
+    controller._encode_record = uac.ACTION_LOG_FORMATS["jsonl"]
+    controller._log_fp = None
+    controller._log_mode = "xb"
+    controller._start_time = controller._end_time = None
+    controller._ts_second, controller._ts_prefix = None, ""
+    controller._set_whitelist(["Spaceship Designer"])
+    return controller
+
+RECORDS = [
+    {"action_type": "whitelist", "whitelisted_windows": ["Spaceship Designer"]},
+    {"action_type": "click", "x": 10, "y": 20},
+    {"action_type": "type_text", "text": "héllo"},
+]
+
+def write_log(path, records, tail=b""):
+    """Write records with the format's encoder, then any raw trailing bytes"""
+    encode = uac.ACTION_LOG_FORMATS[path.suffix[1:]]
+    path.write_bytes(b"".join(encode(record) for record in records) + tail)
+    return path
+
+def test_ts_matches_strftime(controller, monkeypatch):
+    """_ts is strftime("%H%M%S_%f")[:12], reformatting only on a new second"""
+    for now_ns in (1_700_000_000_123_456_789, 1_700_000_000_999_999_999, 1_700_000_001_000_000_000):
+        monkeypatch.setattr(time, "time_ns", lambda: now_ns)
+        expected = time.strftime("%H%M%S_", time.localtime(now_ns // 1_000_000_000))
+        expected += f"{now_ns % 1_000_000_000 // 1000:06d}"[:5]
+        assert controller._ts() == expected
+    assert controller._ts_second == 1_700_000_001
+
+@pytest.mark.parametrize("log_format", ["jsonl", "msgpack"])
+def test_read_action_log_round_trip(tmp_path, log_format):
+    """Records read back exactly as written in either format"""
+    if log_format == "msgpack":
+        pytest.importorskip("msgpack")
+    path = write_log(tmp_path / f"actions_test.{log_format}", RECORDS)
+    assert list(uac.read_action_log(path)) == RECORDS
+
+@pytest.mark.parametrize("cut", [2, 5, 10])
+def test_read_action_log_truncated_jsonl(tmp_path, cut):
+    """A partially written last line ends the log cleanly"""
+    last = uac._jsonl_record({"action_type": "see", "context": "observation"})
+    path = write_log(tmp_path / "actions_test.jsonl", RECORDS, last[:-cut])
+    assert list(uac.read_action_log(path)) == RECORDS
+
+def test_read_action_log_corrupt_jsonl_line_raises(tmp_path):
+    """Damage before the last line is not mistaken for a partial write"""
+    path = write_log(tmp_path / "actions_test.jsonl", RECORDS[:1], b"{not json\n")
+    path.write_bytes(path.read_bytes() + uac._jsonl_record(RECORDS[1]))
+    with pytest.raises(ValueError):
+        list(uac.read_action_log(path))
+
+@pytest.mark.parametrize("cut", [1, 3, 5, 8])
+def test_read_action_log_truncated_msgpack(tmp_path, cut):
+    """A last record cut short in its length prefix or its data ends the log"""
+    pytest.importorskip("msgpack")
+    last = uac._msgpack_record({"action_type": "see", "context": "observation"})
+    path = write_log(tmp_path / "actions_test.msgpack", RECORDS, last[:-cut])
+    assert list(uac.read_action_log(path)) == RECORDS
+
+def test_read_action_log_incomplete_msgpack_record(tmp_path):
+    """A full-length but undecodable last record also ends the log"""
+    pytest.importorskip("msgpack")
+    path = write_log(tmp_path / "actions_test.msgpack", RECORDS, uac.LOG_RECORD_PREFIX.pack(1) + b"\x92")
+    assert list(uac.read_action_log(path)) == RECORDS
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("eased", [False, True])
+def test_plan_path(controller, monkeypatch, use_numpy, eased):
+    """Paths sample at ~60Hz, exclude the start and end exactly on the target"""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(uac, "HAS_NUMPY", use_numpy)
+    points, interval = controller._plan_path(0, 0, 300, -120, 0.5, eased=eased)
+    assert len(points) == 30
+    assert interval == pytest.approx(0.5 / 30)
+    assert points[-1] == (300, -120)
+    assert points[0] != (0, 0)
+    assert all(isinstance(coord, int) for point in points for coord in point)
+    xs = [x for x, _ in points]
+    assert xs == sorted(xs)
+    if eased:
+        # easeInOutQuad starts slower than the linear path
+        assert points[0][0] < 300 / 30
+    else:
+        assert points[0] == (10, -4)
+
+def test_plan_path_short_duration(controller):
+    """Durations under one frame still take a single step"""
+    points, interval = controller._plan_path(5, 5, 6, 7, 0.001)
+    assert points == [(6, 7)]
+    assert interval == pytest.approx(0.001)
+
+def test_whitelist_matching(controller):
+    """Whitelist names match anywhere in a title, case-insensitively and literally"""
+    controller._set_whitelist(["Spaceship Designer", "Notes (dev)"])
+    assert controller._matches_whitelist("Spaceship Designer")
+    assert controller._matches_whitelist("untitled - SPACESHIP designer v2")
+    assert controller._matches_whitelist("notes (DEV)")
+    assert not controller._matches_whitelist("Notes dev")
+    assert not controller._matches_whitelist("Spaceship")
+    assert controller._is_window_allowed("")
+
+def test_empty_whitelist_matches_nothing(controller):
+    """An empty whitelist allows only the desktop's empty title"""
+    controller._set_whitelist([])
+    assert not controller._matches_whitelist("Spaceship Designer")
+    assert not controller._matches_whitelist("")
+    assert controller._is_window_allowed("")
+
+@pytest.mark.parametrize("distance, window_info, expected", [
+    (0, None, 0.1),
+    (39, None, 0.1),
+    (40, None, 0.1),
+    (41, None, 41 / 400),
+    (49, None, 49 / 400),
+    (400, None, 1.0),
+    (2000, None, 3.0),
+    (49, {"left": 0}, 0.1),
+    (50, {"left": 0}, 0.1),
+    (60, {"left": 0}, 60 / 500),
+    (1000, {"left": 0}, 2.0),
+])
+def test_calculate_movement_durations(controller, distance, window_info, expected):
+    """Durations follow the speed bands, with micro-moves at the 0.1s floor"""
+    moved, duration = controller._calculate_movement(100, 100, 100 + distance, 100, window_info)
+    assert moved == pytest.approx(distance)
+    assert duration == pytest.approx(expected)
+
+def test_sessions_started_in_the_same_second_get_their_own_logs(tmp_path):
+    """A session id already taken on disk gets the next numbered suffix"""
+    sessions = [make_session(object.__new__(uac.UniversalAIController), tmp_path) for _ in range(3)]
+    for number, session in enumerate(sessions):
+        session._log_action({"action_type": "wait", "action_id": number})
+        session._log_fp.close()
+    
+    assert [session.session_id for session in sessions] == [
+        "20250101_120000", "20250101_120000_2", "20250101_120000_3"
+    ]
+    for number, session in enumerate(sessions):
+        assert session.frames_file.name == f"frames_{session.session_id}.bin"
+        whitelist, action = uac.read_action_log(session.actions_file)
+        assert whitelist["session_id"] == session.session_id
+        assert action["action_id"] == number
+
+def test_log_action_survives_write_errors(controller, tmp_path):
+    """An unwritable action log is reported but never fails the action"""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    make_session(controller, blocker / "ai_sessions")
+    controller._log_action({"action_type": "wait", "timestamp": "120000_00000"})
+    assert controller.session_log == [{"action_type": "wait", "timestamp": "120000_00000"}]
+    assert controller._end_time == "120000_00000"
+
+def test_wait_for_screenshot_reports_reaped_failures(controller):
+    """A failed save still raises after a later see() has reaped it"""
+    failed, saved = Future(), Future()
+    failed.set_exception(OSError("disk full"))
+    saved.set_result(None)
+    controller._pending_saves = deque([("s1.jpg", failed), ("s2.jpg", saved)])
+    controller._failed_saves = {}
+    controller._reap_saves()
+    
+    assert not controller._pending_saves
+    with pytest.raises(OSError, match="disk full"):
+        controller.wait_for_screenshot({"screenshot_path": "s1.jpg"})
+    assert controller.wait_for_screenshot({"screenshot_path": "s2.jpg"}) == "s2.jpg"
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+WIN32 INPUT UNIT TESTS
+INPUT event builders used by the universal AI controller
+
+user32 is only loaded when input is actually sent, so the builders are
+exercised here on any platform.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The input helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import _win_input as wi
+
+# (left, top, width, height): single monitors, and a second monitor left of
+# and above the primary so the virtual desktop starts at negative coordinates
+SCREENS = [
+    (0, 0, 1920, 1080),
+    (0, 0, 3840, 2160),
+    (0, 0, 1366, 768),
+    (-1280, -300, 3200, 1380),
+]
+
+def windows_pixel(n, origin, extent):
+    """The pixel Windows maps a normalized absolute coordinate back to"""
+    return origin + n * extent // 65536
+
+@pytest.mark.parametrize("screen", SCREENS)
+def test_move_input_round_trips_every_pixel(screen):
+    """floor(dx * w / 65536) lands on exactly the requested pixel"""
+    left, top, width, height = screen
+    for x in range(left, left + width):
+        event = wi.move_input(x, top, screen)
+        assert windows_pixel(event.mi.dx, left, width) == x
+    for y in range(top, top + height):
+        event = wi.move_input(left, y, screen)
+        assert windows_pixel(event.mi.dy, top, height) == y
+
+def test_move_input_flags():
+    """Moves are absolute over the whole virtual desktop"""
+    event = wi.move_input(10, 10, SCREENS[0])
+    assert event.type == wi.INPUT_MOUSE
+    assert event.mi.dwFlags == wi.MOUSEEVENTF_MOVE | wi.MOUSEEVENTF_ABSOLUTE | wi.MOUSEEVENTF_VIRTUALDESK
+
+def describe(inputs):
+    """(virtual key, unicode scan code, key up) for each keyboard event"""
+    return [
+        (event.ki.wVk, event.ki.wScan, bool(event.ki.dwFlags & wi.KEYEVENTF_KEYUP))
+        for event in inputs
+    ]
+
+def typed(char):
+    """Unicode down/up events for one character"""
+    return [(0, ord(char), False), (0, ord(char), True)]
+
+def pressed(key):
+    """Virtual-key down/up events for a named key"""
+    vk = wi.VK_CODES[key]
+    return [(vk, 0, False), (vk, 0, True)]
+
+@pytest.mark.parametrize("char, key", [("\n", "enter"), ("\r", "enter"), ("\t", "tab"), ("\b", "backspace")])
+def test_text_inputs_presses_control_keys(char, key):
+    """Control characters become key presses between Unicode runs"""
+    assert describe(wi.text_inputs(f"a{char}b")) == typed("a") + pressed(key) + typed("b")
+
+def test_text_inputs_edge_control_characters():
+    """Leading, trailing and repeated control characters are each pressed once"""
+    assert describe(wi.text_inputs("\tx\n\n")) == (
+        pressed("tab") + typed("x") + pressed("enter") + pressed("enter")
+    )
+
+def test_text_inputs_plain_and_surrogate_text():
+    """Plain text is typed as UTF-16 units, surrogate pairs included"""
+    assert describe(wi.text_inputs("hi")) == typed("h") + typed("i")
+    high, low = 0xD83D, 0xDE80  # U+1F680
+    assert describe(wi.text_inputs("\U0001F680")) == [
+        (0, high, False), (0, high, True), (0, low, False), (0, low, True)
+    ]
+    assert wi.text_inputs("") == []
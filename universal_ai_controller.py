@@ -4,13 +4,187 @@ Universal Real-time AI Controller
 Secure real-time AI control with whitelist protection
 """
 
-import pyautogui
 import time
+import math
+import sys
+import atexit
+import queue
+import logging
+import logging.handlers
+import threading
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
 from datetime import datetime
 from pathlib import Path
+from collections import deque
+import io
+import os
 import json
-import win32gui
-from PIL import ImageGrab
+import re
+import struct
+import zlib
+
+try:
+    import mss
+    HAS_MSS = True
+except ImportError:
+    HAS_MSS = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# In-memory action history bound; the JSONL action log keeps everything
+SESSION_LOG_MAXLEN = 10_000
+
+logger = logging.getLogger(__name__)
+
+# Moves shorter than this take the 0.1s minimum duration (see _calculate_movement)
+MICRO_MOVE_PX = 40
+
+# Screenshots queued for the save thread before see() waits for the oldest
+MAX_PENDING_SAVES = 64
+
+# Length prefix of each record in a msgpack action log
+LOG_RECORD_PREFIX = struct.Struct("<I")
+
+# Packed frame record header: action_id, time_ns, width, height, byte length
+FRAME_HEADER = struct.Struct("<IQHHI")
+
+# GUI automation stack, imported by the first controller rather than at module
+# import: pyautogui alone pulls in pyscreeze, pygetwindow, mouseinfo and pyperclip
+pyautogui = None
+win32gui = win32ui = win32con = None
+_win_input = None
+Image = None
+
+# Bound win32 calls used by the per-action security check
+_GetForegroundWindow = _GetWindowText = None
+
+def _import_gui_modules():
+    """Import pyautogui, pywin32, Pillow and _win_input into module scope once"""
+    global pyautogui, win32gui, win32ui, win32con, _win_input, Image
+    global _GetForegroundWindow, _GetWindowText
+    if pyautogui is not None:
+        return
+    import win32gui
+    import win32ui
+    import win32con
+    import _win_input
+    from PIL import Image
+    _GetForegroundWindow = win32gui.GetForegroundWindow
+    _GetWindowText = win32gui.GetWindowText
+    import pyautogui
+
+_log_listener = None
+
+def enable_console_logging(level=logging.INFO):
+    """Print controller messages to stdout from a background thread
+    
+    Records go through a QueueHandler, so actions never wait on the
+    console; a QueueListener thread does the writing. Does nothing if the
+    application has already configured logging handlers.
+    """
+    global _log_listener
+    logger.setLevel(level)
+    if _log_listener is not None or logger.hasHandlers():
+        return
+    
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, console)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def _dumps(entry):
+    """Serialize a log entry or summary as compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(entry)
+    return json.dumps(entry, separators=(",", ":")).encode("utf-8")
+
+def _jsonl_record(entry):
+    """One action log record as a JSON line"""
+    return _dumps(entry) + b"\n"
+
+def _msgpack_record(entry):
+    """One action log record as length-prefixed msgpack"""
+    data = msgpack.packb(entry, use_bin_type=True)
+    return LOG_RECORD_PREFIX.pack(len(data)) + data
+
+ACTION_LOG_FORMATS = {"jsonl": _jsonl_record, "msgpack": _msgpack_record}
+
+def read_action_log(path):
+    """Yield the records of an actions_<session> log written in either format
+    
+    A last record cut short by a crash mid-write ends the log; damage
+    anywhere before it still raises.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        if path.suffix == ".msgpack":
+            while True:
+                prefix = f.read(LOG_RECORD_PREFIX.size)
+                if len(prefix) < LOG_RECORD_PREFIX.size:
+                    break
+                (length,) = LOG_RECORD_PREFIX.unpack(prefix)
+                data = f.read(length)
+                if len(data) < length:
+                    break
+                try:
+                    record = msgpack.unpackb(data, raw=False)
+                except (ValueError, msgpack.OutOfData):
+                    # unpackb reports incomplete input as ValueError (ExtraData
+                    # is a subclass); only the last record may be damaged
+                    if f.read(1):
+                        raise
+                    break
+                yield record
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Only the unterminated last line can be a partial write
+                    if line.endswith(b"\n"):
+                        raise
+                    break
+                yield record
+
+def _frame_digest(screenshot):
+    """Cheap content hash of a captured frame, used to detect unchanged frames"""
+    pixels = screenshot.tobytes()
+    if HAS_XXHASH:
+        return screenshot.size, xxhash.xxh3_64_intdigest(pixels)
+    return screenshot.size, zlib.crc32(pixels)
+
+def _ease_in_out_quad(t):
+    """Quadratic ease-in/out over 0..1 (same curve as pyautogui.easeInOutQuad)"""
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
 
 class UniversalAIController:
     """
@@ -23,61 +197,223 @@ class UniversalAIController:
     5. Complete audit trail with security logging
     """
     
-    def __init__(self):
+    __slots__ = (
+        "session_dir", "window_whitelist", "_whitelist_re",
+        "bounds_cache_ttl", "_bounds_cache", "_bounds_cache_ts", "_target_hwnd",
+        "foreground_cache_ttl", "_fg_cache",
+        "session_id", "action_count", "security_violations", "_ts_second", "_ts_prefix",
+        "session_log", "actions_file", "_encode_record", "_log_fp", "_log_mode", "_start_time", "_end_time",
+        "safe_mode", "_screen_w", "_screen_h", "_last_cursor",
+        "lossless_screenshots", "pack_frames", "frames_file", "_frames_fp",
+        "skip_unchanged", "_last_frame",
+        "_action_executor", "_save_pool", "_pending_saves", "_failed_saves", "_sct_local", "_sct_instances", "_gdi",
+    )
+    
+    def __init__(self, lossless_screenshots=False, pack_frames=False, safe_mode=False,
+                 skip_unchanged=False, console_log=True, log_format="jsonl"):
+        if log_format not in ACTION_LOG_FORMATS:
+            raise ValueError(f"Unknown action log format: {log_format}")
+        if log_format == "msgpack" and not HAS_MSGPACK:
+            raise ImportError("log_format='msgpack' requires the msgpack package")
+        
+        _import_gui_modules()
+        if console_log:
+            enable_console_logging()
+        
+        # Created, with the whitelist record, on the first write (see _open_session)
         self.session_dir = Path("ai_sessions")
-        self.session_dir.mkdir(exist_ok=True)
         
         # Security: ONLY the development app is whitelisted
-        self.window_whitelist = [
+        self._set_whitelist([
             "Spaceship Designer",
             "Optimized Spaceship"
-        ]
+        ])
+        
+        # Target window lookup cache (see _get_target_window_bounds)
+        self.bounds_cache_ttl = 0.25
+        self._bounds_cache = None
+        self._bounds_cache_ts = float("-inf")
+        self._target_hwnd = None
+        
+        # Foreground window title cache (see _get_active_window_title)
+        self.foreground_cache_ttl = 0.05
+        self._fg_cache = (None, "", float("-inf"))
         
         # Session tracking
-        self.session_id = datetime.now().strftime("%H%M%S")
+        # Dated so each session gets its own action log and frames file
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.action_count = 0
-        self.session_log = []
         self.security_violations = 0
+        self._ts_second = None
+        self._ts_prefix = ""
+        
+        # Recent actions stay in memory; the full stream goes to the action
+        # log, as JSON lines or length-prefixed msgpack (see read_action_log)
+        self.session_log = deque(maxlen=SESSION_LOG_MAXLEN)
+        self.actions_file = self.session_dir / f"actions_{self.session_id}.{log_format}"
+        self._encode_record = ACTION_LOG_FORMATS[log_format]
+        self._log_fp = None
+        self._log_mode = "xb"  # "ab" once close() has released the session's files
+        self._start_time = None
+        self._end_time = None
         
-        # Configure for responsive control
-        pyautogui.PAUSE = 0.2
+        # Configure for responsive control. Moves, clicks and typing go
+        # through _win_input directly and FAILSAFE is checked before each
+        # action. safe_mode restores the old pacing: a 0.2s PAUSE after
+        # pyautogui fallbacks and a short settle before clicks and drags
+        self.safe_mode = safe_mode
+        pyautogui.PAUSE = 0.2 if safe_mode else 0
         pyautogui.FAILSAFE = True
         
-        print(f"Universal AI Controller initialized - Session {self.session_id}")
-        print(f"Window whitelist: {len(self.window_whitelist)} allowed applications")
+        # Screen resolution is fixed for the session; the cursor position is
+        # tracked from our own actions instead of re-queried each time
+        self._screen_w, self._screen_h = pyautogui.size()
+        self._last_cursor = None
+        
+        # Screenshot encoding: JPEG by default, fast-compressed PNG when the
+        # audit trail needs exact pixels
+        self.lossless_screenshots = lossless_screenshots
+        
+        # pack_frames: append every screenshot to one frames_<session>.bin
+        # instead of writing one image file per observation
+        self.pack_frames = pack_frames
+        self.frames_file = self.session_dir / f"frames_{self.session_id}.bin"
+        self._frames_fp = None
+        
+        # skip_unchanged: when a capture hashes the same as the previous one,
+        # reuse that frame instead of encoding and writing it again
+        self.skip_unchanged = skip_unchanged
+        self._last_frame = None  # (digest, frame_location, saved_to)
+        
+        # Worker thread for the async API, created on first use
+        self._action_executor = None
+        
+        # Screenshot files are encoded on a background thread so see() can
+        # return as soon as the frame is captured (see _save_in_background)
+        self._save_pool = None
+        self._pending_saves = deque()  # (screenshot path, future), oldest first
+        self._failed_saves = {}  # screenshot path -> exception, kept for wait_for_screenshot
+        
+        # Screen grabbers: mss keeps its device contexts in thread-local
+        # storage, so each capturing thread (the caller's, the async action
+        # thread) gets its own instance, created once and reused (see _grabber)
+        self._sct_local = threading.local()
+        self._sct_instances = []
+        self._gdi = None  # GDI capture fallback, see _grab_gdi
+        
+        logger.info("Universal AI Controller initialized - Session %s", self.session_id)
+        logger.info("Window whitelist: %d allowed applications", len(self.window_whitelist))
+    
+    def _open_session(self):
+        """Create the session directory, open the action log and log the whitelist
+        
+        After close() the log is reopened for appending, without a second
+        whitelist record.
+        """
+        self.session_dir.mkdir(exist_ok=True)
+        if self._log_mode == "ab":
+            self._log_fp = open(self.actions_file, "ab", buffering=1 << 20)
+            return
+        
+        # Session ids have one-second resolution: a controller started in the
+        # same second as another takes the next free numbered suffix
+        base_id, suffix = self.session_id, 1
+        while True:
+            try:
+                self._log_fp = open(self.actions_file, "xb", buffering=1 << 20)
+                break
+            except FileExistsError:
+                suffix += 1
+                self.session_id = f"{base_id}_{suffix}"
+                self.actions_file = self.actions_file.with_name(f"actions_{self.session_id}{self.actions_file.suffix}")
+                self.frames_file = self.frames_file.with_name(f"frames_{self.session_id}.bin")
         self._log_whitelist()
     
     def _log_whitelist(self):
-        """Log current whitelist for transparency"""
+        """Log current whitelist for transparency, as the action log's first record"""
         whitelist_log = {
+            "action_type": "whitelist",
             "session_id": self.session_id,
             "whitelist": self.window_whitelist,
-            "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+            "timestamp": self._ts()
         }
         
-        whitelist_file = self.session_dir / f"whitelist_{self.session_id}.json"
-        with open(whitelist_file, 'w') as f:
-            json.dump(whitelist_log, f, indent=2)
-        
-        print(f"Whitelist logged: {whitelist_file}")
+        self._log_fp.write(self._encode_record(whitelist_log))
+        logger.info("Whitelist logged: %s", self.actions_file)
     
-    def _is_window_allowed(self, window_title=""):
-        """Check if window is in whitelist"""
-        if not window_title:
-            return True  # Allow desktop/general screenshots
+    def _sync_logs(self):
+        """Flush the action and frame logs through to disk"""
+        for fp in (self._log_fp, self._frames_fp):
+            if fp is not None:
+                fp.flush()
+                os.fsync(fp.fileno())
+    
+    def _cursor_position(self):
+        """Cursor position: where our last action left it, else queried once"""
+        if self._last_cursor is None:
+            position = pyautogui.position()
+            self._last_cursor = (position.x, position.y)
+        return self._last_cursor
+    
+    def _ts(self):
+        """Action timestamp in the HHMMSS_fffff form of strftime("%H%M%S_%f")[:12]
         
-        # Check against whitelist
-        for allowed in self.window_whitelist:
-            if allowed.lower() in window_title.lower():
-                return True
+        The HHMMSS_ prefix is only reformatted when the second changes.
+        """
+        second, nanos = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%H%M%S_", time.localtime(second))
+        return f"{self._ts_prefix}{nanos // 10_000:05d}"
+    
+    def _log_action(self, entry):
+        """Record an action in memory and append it to the action log"""
+        self.session_log.append(entry)
+        try:
+            if self._log_fp is None:
+                self._open_session()
+            self._log_fp.write(self._encode_record(entry))
+        except OSError:
+            # The entry is still in session_log; a log failure never fails the action
+            logger.exception("Could not write to action log %s", self.actions_file)
         
-        return False
+        timestamp = entry.get("timestamp")
+        if timestamp:
+            self._start_time = self._start_time or timestamp
+            self._end_time = timestamp
+    
+    def _set_whitelist(self, window_names):
+        """Set the window whitelist and compile its case-insensitive matcher"""
+        self.window_whitelist = list(window_names)
+        # One alternation scans a title for every name at once; an empty
+        # whitelist gets a pattern that never matches
+        pattern = "|".join(re.escape(name) for name in self.window_whitelist) or "(?!)"
+        self._whitelist_re = re.compile(pattern, re.IGNORECASE)
+    
+    def _matches_whitelist(self, window_title):
+        """Check whether a window title contains any whitelisted name"""
+        return self._whitelist_re.search(window_title) is not None
+    
+    def _is_window_allowed(self, window_title=""):
+        """Check if window is in whitelist (empty titles are the desktop, allowed)"""
+        return not window_title or self._matches_whitelist(window_title)
     
     def _get_active_window_title(self):
-        """Get title of currently active window"""
+        """Get title of currently active window
+        
+        The foreground handle is checked on every call, but its title is
+        re-read only when the handle changes or the cached title is older
+        than foreground_cache_ttl.
+        """
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            window_title = win32gui.GetWindowText(hwnd)
+            hwnd = _GetForegroundWindow()
+            cached_hwnd, cached_title, cached_at = self._fg_cache
+            now = time.monotonic()
+            if hwnd == cached_hwnd and now - cached_at < self.foreground_cache_ttl:
+                return cached_title
+            
+            window_title = _GetWindowText(hwnd)
+            self._fg_cache = (hwnd, window_title, now)
             return window_title
         except ImportError:
             # Fallback if win32gui not available
@@ -96,55 +432,282 @@ class UniversalAIController:
                 "violation_id": self.security_violations,
                 "action_type": action_type,
                 "blocked_window": active_window,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12],
+                "timestamp": self._ts(),
                 "reason": "Window not in whitelist"
             }
             
-            self.session_log.append(violation)
+            self._log_action(violation)
             
-            print(f"SECURITY BLOCK #{self.security_violations}: '{active_window}' not whitelisted")
+            logger.warning("SECURITY BLOCK #%d: '%s' not whitelisted", self.security_violations, active_window)
             return False, violation
         
-        print(f"Security check passed: '{active_window}' is whitelisted")
+        logger.debug("Security check passed: '%s' is whitelisted", active_window)
         return True, {"allowed_window": active_window}
     
+    def _whitelisted_windows(self):
+        """Yield visible whitelisted (hwnd, title) pairs
+        
+        Windows titled exactly as a whitelist entry are looked up directly
+        with FindWindow; the EnumWindows scan for titles that merely contain
+        an entry only runs if the caller asks for more.
+        """
+        for name in self.window_whitelist:
+            try:
+                hwnd = win32gui.FindWindow(None, name)
+            except win32gui.error:
+                continue
+            if hwnd and win32gui.IsWindowVisible(hwnd):
+                yield hwnd, name
+        
+        def enum_window_callback(hwnd, windows):
+            if win32gui.IsWindowVisible(hwnd):
+                window_text = win32gui.GetWindowText(hwnd)
+                if window_text:
+                    windows.append((hwnd, window_text))
+            return True
+        
+        windows = []
+        win32gui.EnumWindows(enum_window_callback, windows)
+        
+        for hwnd, title in windows:
+            if self._matches_whitelist(title):
+                yield hwnd, title
+    
+    def _find_target_window(self):
+        """First visible whitelisted window as (hwnd, title), else (None, None)"""
+        return next(self._whitelisted_windows(), (None, None))
+    
     def _get_target_window_bounds(self):
-        """Get bounds of target application window for cropping"""
+        """Get bounds of target application window for cropping
+        
+        Results are cached for bounds_cache_ttl seconds, and the window
+        handle is kept until it closes or stops matching the whitelist,
+        so EnumWindows only runs when the target has to be found again.
+        """
+        now = time.monotonic()
+        if now - self._bounds_cache_ts < self.bounds_cache_ttl:
+            return self._bounds_cache
+        
         try:
-            def enum_window_callback(hwnd, windows):
-                if win32gui.IsWindowVisible(hwnd):
-                    window_text = win32gui.GetWindowText(hwnd)
-                    if window_text:
-                        windows.append((hwnd, window_text))
-                return True
+            hwnd = self._target_hwnd
+            title = win32gui.GetWindowText(hwnd) if hwnd and win32gui.IsWindow(hwnd) else ""
+            if not self._matches_whitelist(title):
+                hwnd, title = self._find_target_window()
             
-            windows = []
-            win32gui.EnumWindows(enum_window_callback, windows)
-            
-            # Look for whitelisted windows
-            for hwnd, title in windows:
-                if any(allowed.lower() in title.lower() for allowed in self.window_whitelist):
-                    rect = win32gui.GetWindowRect(hwnd)
-                    return {
-                        "hwnd": hwnd,
-                        "title": title,
-                        "left": rect[0],
-                        "top": rect[1],
-                        "right": rect[2], 
-                        "bottom": rect[3],
-                        "width": rect[2] - rect[0],
-                        "height": rect[3] - rect[1]
+            window_info = None
+            if hwnd:
+                rect = win32gui.GetWindowRect(hwnd)
+                window_info = {
+                    "hwnd": hwnd,
+                    "title": title,
+                    "left": rect[0],
+                    "top": rect[1],
+                    "right": rect[2], 
+                    "bottom": rect[3],
+                    "width": rect[2] - rect[0],
+                    "height": rect[3] - rect[1]
+                }
+                
+                # Screenshots only need the client area, without the title
+                # bar, borders and drop shadow (whole window if it is empty)
+                _, _, client_w, client_h = win32gui.GetClientRect(hwnd)
+                if client_w > 0 and client_h > 0:
+                    client_left, client_top = win32gui.ClientToScreen(hwnd, (0, 0))
+                    window_info["client"] = {
+                        "left": client_left,
+                        "top": client_top,
+                        "width": client_w,
+                        "height": client_h
+                    }
+                else:
+                    window_info["client"] = {
+                        key: window_info[key] for key in ("left", "top", "width", "height")
                     }
-            
-            return None
-            
         except Exception:
-            return None
+            hwnd, window_info = None, None
         
+        self._target_hwnd = hwnd
+        self._bounds_cache = window_info
+        self._bounds_cache_ts = now
+        return window_info
+    
+    def _grab_gdi(self, left, top, width, height):
+        """BitBlt only the requested screen rectangle into a memory DC
+        
+        The screen DC, memory DC and bitmap are created on first use and
+        kept for later captures; the bitmap is only reallocated when a
+        capture is larger than any before it.
+        """
+        if self._gdi is None:
+            hwnd_dc = win32gui.GetWindowDC(0)
+            src_dc = win32ui.CreateDCFromHandle(hwnd_dc)
+            self._gdi = {
+                "hwnd_dc": hwnd_dc,
+                "src_dc": src_dc,
+                "mem_dc": src_dc.CreateCompatibleDC(),
+                "bitmap": None,
+                "size": (0, 0)
+            }
+        gdi = self._gdi
+        
+        capacity_w, capacity_h = gdi["size"]
+        if width > capacity_w or height > capacity_h:
+            capacity_w, capacity_h = max(width, capacity_w), max(height, capacity_h)
+            bitmap = win32ui.CreateBitmap()
+            bitmap.CreateCompatibleBitmap(gdi["src_dc"], capacity_w, capacity_h)
+            gdi["mem_dc"].SelectObject(bitmap)
+            if gdi["bitmap"] is not None:
+                win32gui.DeleteObject(gdi["bitmap"].GetHandle())
+            gdi["bitmap"], gdi["size"] = bitmap, (capacity_w, capacity_h)
+        
+        gdi["mem_dc"].BitBlt((0, 0), (width, height), gdi["src_dc"], (left, top), win32con.SRCCOPY)
+        bits = gdi["bitmap"].GetBitmapBits(True)
+        image = Image.frombuffer("RGB", (capacity_w, capacity_h), bits, "raw", "BGRX", 0, 1)
+        return image.crop((0, 0, width, height)) if (width, height) != (capacity_w, capacity_h) else image
+    
+    def _release_gdi(self):
+        """Release the cached GDI capture resources"""
+        if self._gdi is None:
+            return
+        gdi, self._gdi = self._gdi, None
+        if gdi["bitmap"] is not None:
+            win32gui.DeleteObject(gdi["bitmap"].GetHandle())
+        gdi["mem_dc"].DeleteDC()
+        gdi["src_dc"].DeleteDC()
+        win32gui.ReleaseDC(0, gdi["hwnd_dc"])
+    
+    def _grabber(self):
+        """This thread's mss instance, created on its first capture"""
+        sct = getattr(self._sct_local, "sct", None)
+        if sct is None:
+            sct = self._sct_local.sct = mss.mss()
+            self._sct_instances.append(sct)
+        return sct
+    
+    def _capture(self, window_info, context):
+        """Capture the target window's client area (or full screen) as a PIL image"""
+        crop = window_info is not None and context != "full_screen"
+        screenshot_type = "cropped_to_window" if crop else "full_screen"
+        
+        if HAS_MSS:
+            try:
+                sct = self._grabber()
+                # mss grabs only the requested region - no full-screen copy to crop
+                region = window_info["client"] if crop else sct.monitors[1]  # Primary monitor
+                shot = sct.grab(region)
+                # Decode straight from mss's raw buffer; shot.bgra would copy it first
+                return Image.frombuffer("RGB", shot.size, shot.raw, "raw", "BGRX", 0, 1), screenshot_type
+            except Exception as e:
+                logger.warning("mss capture failed, falling back to GDI: %s", e)
+        
+        if crop:
+            # Without mss (or if it failed), blit just the client rectangle through GDI
+            client = window_info["client"]
+            screenshot = self._grab_gdi(client["left"], client["top"], client["width"], client["height"])
+        else:
+            screenshot = self._grab_gdi(0, 0, self._screen_w, self._screen_h)
+        
+        return screenshot, screenshot_type
+        
+    def _encode_screenshot(self, screenshot, target):
+        """Encode a screenshot to a path or binary stream in the session format"""
+        if self.lossless_screenshots:
+            screenshot.save(target, "PNG", compress_level=1)
+        else:
+            screenshot.save(target, "JPEG", quality=85, optimize=False)
+    
+    def _write_screenshot(self, screenshot, filepath):
+        """Encode a screenshot to a temporary name, then move it onto filepath
+        
+        Readers polling filepath never see a missing-then-partial image.
+        """
+        temp_path = filepath.with_name(f".{filepath.name}.tmp")
+        self._encode_screenshot(screenshot, temp_path)
+        os.replace(temp_path, filepath)
+    
+    def _save_in_background(self, screenshot, filepath):
+        """Queue a screenshot to be written to filepath on the save thread
+        
+        At most MAX_PENDING_SAVES frames are held in memory; beyond that
+        see() waits for the oldest save, so a slow disk applies backpressure.
+        """
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai_controller_save")
+        self._reap_saves()
+        if len(self._pending_saves) >= MAX_PENDING_SAVES:
+            wait_for_futures([self._pending_saves[0][1]])
+            self._reap_saves()
+        future = self._save_pool.submit(self._write_screenshot, screenshot, filepath)
+        self._pending_saves.append((str(filepath), future))
+    
+    def _reap_saves(self):
+        """Drop finished background saves, reporting and keeping any that failed"""
+        while self._pending_saves and self._pending_saves[0][1].done():
+            path, future = self._pending_saves.popleft()
+            error = future.exception()
+            if error is not None:
+                logger.error("Screenshot save failed: %s", error)
+                self._failed_saves[path] = error
+    
+    def _wait_for_saves(self):
+        """Block until every queued screenshot is on disk"""
+        wait_for_futures([future for _, future in self._pending_saves])
+        self._reap_saves()
+    
+    def wait_for_screenshot(self, observation, timeout=None):
+        """Block until an observation's screenshot file has been written
+        
+        see() returns while the file is still being encoded; call this
+        before opening observation["screenshot_path"]. Re-raises the save
+        error if writing that file failed.
+        """
+        screenshot_path = observation.get("screenshot_path")
+        for path, future in list(self._pending_saves):
+            if path == screenshot_path:
+                future.result(timeout)
+                break
+        # Saves reaped by a later see() leave their errors here
+        error = self._failed_saves.get(screenshot_path)
+        if error is not None:
+            raise error
+        return screenshot_path
+    
+    def _append_frame(self, screenshot):
+        """Append one encoded frame to the packed frames file, returning its offset
+        
+        Each record is a FRAME_HEADER (action_id, time_ns, width, height,
+        byte length) followed by the encoded image bytes.
+        """
+        if self._frames_fp is None:
+            if self._log_fp is None:
+                self._open_session()
+            self._frames_fp = open(self.frames_file, self._log_mode)
+        
+        buffer = io.BytesIO()
+        self._encode_screenshot(screenshot, buffer)
+        data = buffer.getvalue()
+        
+        offset = self._frames_fp.tell()
+        self._frames_fp.write(FRAME_HEADER.pack(
+            self.action_count, time.time_ns(), screenshot.width, screenshot.height, len(data)
+        ))
+        self._frames_fp.write(data)
+        return offset
+    
+    def read_frame(self, offset):
+        """Read back a packed frame as (header fields dict, encoded image bytes)"""
+        if self._frames_fp is not None:
+            self._frames_fp.flush()
+        with open(self.frames_file, "rb") as f:
+            f.seek(offset)
+            action_id, time_ns, width, height, length = FRAME_HEADER.unpack(f.read(FRAME_HEADER.size))
+            data = f.read(length)
+        return {"action_id": action_id, "time_ns": time_ns, "width": width, "height": height}, data
+    
     def see(self, context="observation"):
         """AI VISION: Take screenshot with security validation"""
         self.action_count += 1
-        timestamp = datetime.now().strftime("%H%M%S_%f")[:12]
+        timestamp = self._ts()
         
         # Security check
         allowed, security_info = self._security_check("screenshot")
@@ -157,75 +720,98 @@ class UniversalAIController:
                 "security_violation": security_info,
                 "message": "Screenshot blocked: Window not in whitelist"
             }
-            self.session_log.append(violation_response)
-            print(f"SEE #{self.action_count}: BLOCKED - {security_info['blocked_window']}")
+            self._log_action(violation_response)
+            logger.warning("SEE #%d: BLOCKED - %s", self.action_count, security_info['blocked_window'])
             return violation_response
         
-        # Proceed with screenshot if allowed
-        # STEP 1: Capture full screen immediately
-        screenshot = pyautogui.screenshot()
-        
-        # STEP 2: Crop immediately after capture if window found
+        # Proceed with screenshot if allowed. The file itself is written on
+        # the save thread: use wait_for_screenshot() before reading it
         window_info = self._get_target_window_bounds()
-        screenshot_type = "full_screen"
-        
-        if window_info and context != "full_screen":
-            # Crop to application window bounds immediately
-            screenshot = screenshot.crop((
-                window_info["left"],
-                window_info["top"],
-                window_info["right"], 
-                window_info["bottom"]
-            ))
-            screenshot_type = "cropped_to_window"
-        
-        filename = f"s{self.session_id}_{self.action_count:03d}_{context}.png"
-        filepath = self.session_dir / filename
-        screenshot.save(filepath)
+        screenshot, screenshot_type = self._capture(window_info, context)
+        
+        action_type = "observe"
+        digest = _frame_digest(screenshot) if self.skip_unchanged else None
+        if digest is not None and self._last_frame is not None and self._last_frame[0] == digest:
+            _, frame_location, saved_to = self._last_frame
+            action_type = "observe_cached"
+        elif self.pack_frames:
+            # _append_frame opens the session first, which settles the frames file name
+            frame_offset = self._append_frame(screenshot)
+            frame_location = {"frames_file": str(self.frames_file), "frame_offset": frame_offset}
+            saved_to = f"{self.frames_file.name}@{frame_location['frame_offset']}"
+        else:
+            if self._log_fp is None:
+                self._open_session()
+            extension = "png" if self.lossless_screenshots else "jpg"
+            filename = f"s{self.session_id}_{self.action_count:03d}_{context}.{extension}"
+            filepath = self.session_dir / filename
+            self._save_in_background(screenshot, filepath)
+            frame_location = {"screenshot_path": str(filepath)}
+            saved_to = filename
+        
+        if digest is not None:
+            self._last_frame = (digest, frame_location, saved_to)
         
         # Get current mouse position and screen info
         mouse_pos = pyautogui.position()
-        screen_size = pyautogui.size()
+        self._last_cursor = (mouse_pos.x, mouse_pos.y)
         
         observation = {
             "action_id": self.action_count,
             "timestamp": timestamp,
             "context": context,
-            "screenshot_path": str(filepath),
+            **frame_location,
             "screenshot_type": screenshot_type,
             "window_info": window_info,
             "mouse_position": {"x": mouse_pos.x, "y": mouse_pos.y},
-            "screen_size": {"width": screen_size.width, "height": screen_size.height},
-            "action_type": "observe",
+            "screen_size": {"width": self._screen_w, "height": self._screen_h},
+            "action_type": action_type,
             "security_cleared": True,
             "active_window": security_info.get("allowed_window", "Unknown")
         }
         
-        self.session_log.append(observation)
-        print(f"SEE #{self.action_count}: {context} -> {filename}")
+        self._log_action(observation)
+        logger.info("SEE #%d: %s -> %s%s", self.action_count, context, saved_to,
+                    " (unchanged)" if action_type == "observe_cached" else "")
         return observation
         
-    def _constrain_coordinates_to_window(self, x, y):
-        """Constrain coordinates to application window bounds"""
-        window_info = self._get_target_window_bounds()
+    def _constrain_coordinates_to_window(self, x, y, window_info):
+        """Constrain coordinates to application window bounds
         
+        window_info is fetched once by the calling action and passed in, so
+        actions that constrain several points look the window up only once.
+        """
         if not window_info:
             # No window found, return original coordinates
             return x, y, None
         
         # Constrain coordinates to window bounds with padding
         padding = 5  # Keep 5px away from edges
-        constrained_x = max(window_info["left"] + padding, 
-                          min(x, window_info["right"] - padding))
-        constrained_y = max(window_info["top"] + padding,
-                          min(y, window_info["bottom"] - padding))
+        low_x, high_x = window_info["left"] + padding, window_info["right"] - padding
+        low_y, high_y = window_info["top"] + padding, window_info["bottom"] - padding
+        constrained_x = high_x if x > high_x else x
+        constrained_x = low_x if constrained_x < low_x else constrained_x
+        constrained_y = high_y if y > high_y else y
+        constrained_y = low_y if constrained_y < low_y else constrained_y
         
         return constrained_x, constrained_y, window_info
     
-    def _calculate_movement_duration(self, start_x, start_y, end_x, end_y, window_info=None):
-        """Calculate movement duration with speed restrictions"""
+    def _calculate_movement(self, start_x, start_y, end_x, end_y, window_info=None):
+        """Calculate movement distance and duration with speed restrictions
+        
+        Returns (distance, duration) so callers can log the distance
+        without recomputing it.
+        """
         # Calculate distance
-        distance = ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
+        dx, dy = end_x - start_x, end_y - start_y
+        distance_sq = dx * dx + dy * dy
+        
+        # Micro-moves: even at the slowest band's 400 px/sec anything under
+        # 40px would be clamped up to the 0.1s floor anyway
+        if distance_sq < MICRO_MOVE_PX * MICRO_MOVE_PX:
+            return math.sqrt(distance_sq), 0.1
+        
+        distance = math.sqrt(distance_sq)
         
         # Speed restrictions (pixels per second)
         if window_info:
@@ -250,7 +836,7 @@ class UniversalAIController:
         # Absolute bounds for sanity
         duration = max(0.1, min(duration, 3.0))  # 0.1s to 3.0s maximum
         
-        return duration
+        return distance, duration
 
     def move_to(self, x, y, smooth=True, reason="navigation"):
         """AI ACTION: Move mouse to coordinates with STRICT window constraints - CANNOT leave app"""
@@ -258,37 +844,40 @@ class UniversalAIController:
         
         try:
             # Get current position for speed calculation
-            current_pos = pyautogui.position()
+            current_x, current_y = self._cursor_position()
             
             # CRITICAL: Constrain target coordinates to window bounds - NO EXCEPTIONS
-            constrained_x, constrained_y, window_info = self._constrain_coordinates_to_window(x, y)
+            constrained_x, constrained_y, window_info = self._constrain_coordinates_to_window(
+                x, y, self._get_target_window_bounds()
+            )
             
             # SECURITY: If no window info, keep mouse at current position (stick to edge)
             if not window_info:
-                print(f"� MOUSE CONTAINMENT: No target window - keeping current position")
+                logger.warning("� MOUSE CONTAINMENT: No target window - keeping current position")
                 return
             
             # Mouse sticks to window edges instead of blocking movement
             if constrained_x != x or constrained_y != y:
-                print(f"� MOUSE STICK: Constrained ({x},{y}) → ({constrained_x},{constrained_y})")
+                logger.info("� MOUSE STICK: Constrained (%s,%s) → (%s,%s)", x, y, constrained_x, constrained_y)
             
             # Calculate appropriate movement duration
-            duration = self._calculate_movement_duration(
-                current_pos.x, current_pos.y, 
+            distance, duration = self._calculate_movement(
+                current_x, current_y, 
                 constrained_x, constrained_y, 
                 window_info
             )
             
             # Perform movement with calculated duration
             if smooth:
-                pyautogui.moveTo(constrained_x, constrained_y, duration=duration, tween=pyautogui.easeInOutQuad)
+                self._glide(constrained_x, constrained_y, duration, eased=True)
             else:
-                pyautogui.moveTo(constrained_x, constrained_y)
-                
-            actual_pos = pyautogui.position()
+                pyautogui.failSafeCheck()
+                _win_input.set_cursor_pos(constrained_x, constrained_y)
+            
+            # Movement is synchronous: the cursor is now at the constrained target
+            self._last_cursor = (constrained_x, constrained_y)
             
-            # Calculate movement distance and speed for logging
-            distance = ((constrained_x - current_pos.x) ** 2 + (constrained_y - current_pos.y) ** 2) ** 0.5
+            # Calculate movement speed for logging
             speed = distance / duration if duration > 0 else 0
             
             action = {
@@ -296,7 +885,7 @@ class UniversalAIController:
                 "action_type": "move",
                 "target_requested": {"x": x, "y": y},
                 "target_constrained": {"x": constrained_x, "y": constrained_y},
-                "actual": {"x": actual_pos.x, "y": actual_pos.y},
+                "actual": {"x": constrained_x, "y": constrained_y},
                 "movement_info": {
                     "distance_pixels": round(distance, 2),
                     "duration_seconds": round(duration, 3),
@@ -307,13 +896,14 @@ class UniversalAIController:
                 "smooth": smooth,
                 "reason": reason,
                 "success": True,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+                "timestamp": self._ts()
             }
             
-            self.session_log.append(action)
-            constrained_msg = f" -> ({constrained_x}, {constrained_y})" if (constrained_x != x or constrained_y != y) else ""
-            speed_msg = f" [{speed:.0f}px/s]" if speed > 0 else ""
-            print(f"MOVE #{self.action_count}: to ({x}, {y}){constrained_msg}{speed_msg} - {reason}")
+            self._log_action(action)
+            if logger.isEnabledFor(logging.INFO):
+                constrained_msg = f" -> ({constrained_x}, {constrained_y})" if (constrained_x != x or constrained_y != y) else ""
+                speed_msg = f" [{speed:.0f}px/s]" if speed > 0 else ""
+                logger.info(f"MOVE #{self.action_count}: to ({x}, {y}){constrained_msg}{speed_msg} - {reason}")
             return action
             
         except Exception as e:
@@ -323,7 +913,7 @@ class UniversalAIController:
                 "error": str(e),
                 "success": False
             }
-            self.session_log.append(error_action)
+            self._log_action(error_action)
             return error_action
     
     def click(self, x, y, button="left", clicks=1, reason="interaction"):
@@ -341,42 +931,60 @@ class UniversalAIController:
                 "success": False,
                 "message": "Click blocked: Window not in whitelist"
             }
-            self.session_log.append(violation_response)
-            print(f"CLICK #{self.action_count}: BLOCKED at ({x}, {y}) - {security_info['blocked_window']}")
+            self._log_action(violation_response)
+            logger.warning("CLICK #%d: BLOCKED at (%s, %s) - %s", self.action_count, x, y, security_info['blocked_window'])
             return violation_response
         
         try:
             # CRITICAL: Constrain click coordinates to window bounds - NO CLICKS OUTSIDE APP
-            constrained_x, constrained_y, window_info = self._constrain_coordinates_to_window(x, y)
+            constrained_x, constrained_y, window_info = self._constrain_coordinates_to_window(
+                x, y, self._get_target_window_bounds()
+            )
+            
+            current_x, current_y = self._cursor_position()
             
             # SECURITY: Stick click to window edge if no bounds available
             if not window_info:
-                print(f"� CLICK CONTAINMENT: No target window - click at current mouse position")
-                constrained_x, constrained_y = pyautogui.position()
+                logger.warning("� CLICK CONTAINMENT: No target window - click at current mouse position")
+                # The real cursor, not where our last action left it: the
+                # user or another app may have moved it since
+                position = pyautogui.position()
+                current_x, current_y = constrained_x, constrained_y = position.x, position.y
             
             # Clicks stick to window edges instead of being blocked
             if constrained_x != x or constrained_y != y:
-                print(f"� CLICK STICK: Constrained ({x},{y}) → ({constrained_x},{constrained_y})")
+                logger.info("� CLICK STICK: Constrained (%s,%s) → (%s,%s)", x, y, constrained_x, constrained_y)
             
             # Move to constrained position with appropriate speed
-            current_pos = pyautogui.position()
-            duration = self._calculate_movement_duration(
-                current_pos.x, current_pos.y,
+            distance, duration = self._calculate_movement(
+                current_x, current_y,
                 constrained_x, constrained_y,
                 window_info
             )
             
-            pyautogui.moveTo(constrained_x, constrained_y, duration=duration)
-            time.sleep(0.1)
+            # Outside safe_mode a micro-move skips the glide: the absolute
+            # move below jumps straight to the target
+            if self.safe_mode or distance >= MICRO_MOVE_PX:
+                self._glide(constrained_x, constrained_y, duration)
+                if self.safe_mode:
+                    time.sleep(0.1)
+            else:
+                pyautogui.failSafeCheck()
+                duration = 0.0
+            self._last_cursor = (constrained_x, constrained_y)
             
-            # Perform click at constrained coordinates
-            if button == "left":
-                pyautogui.click(constrained_x, constrained_y, clicks=clicks)
-            elif button == "right":
-                pyautogui.rightClick(constrained_x, constrained_y)
+            # Perform click at constrained coordinates: the absolute move and
+            # every down/up pair go out in one SendInput batch, so nothing can
+            # move the cursor between positioning and clicking. Without a
+            # target window the click lands wherever the cursor is, unmoved
+            if button in ("left", "right"):
+                move = [_win_input.move_input(constrained_x, constrained_y)] if window_info else []
+                _win_input.send_inputs([
+                    *move,
+                    *_win_input.click_inputs(button, clicks if button == "left" else 1)
+                ])
             
             # Calculate movement info for logging
-            distance = ((constrained_x - current_pos.x) ** 2 + (constrained_y - current_pos.y) ** 2) ** 0.5
             speed = distance / duration if duration > 0 else 0
                 
             action = {
@@ -395,13 +1003,14 @@ class UniversalAIController:
                 "clicks": clicks,
                 "reason": reason,
                 "success": True,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+                "timestamp": self._ts()
             }
             
-            self.session_log.append(action)
-            constrained_msg = f" -> ({constrained_x}, {constrained_y})" if (constrained_x != x or constrained_y != y) else ""
-            speed_msg = f" [{speed:.0f}px/s]" if speed > 0 else ""
-            print(f"CLICK #{self.action_count}: {button} at ({x}, {y}){constrained_msg}{speed_msg} - {reason}")
+            self._log_action(action)
+            if logger.isEnabledFor(logging.INFO):
+                constrained_msg = f" -> ({constrained_x}, {constrained_y})" if (constrained_x != x or constrained_y != y) else ""
+                speed_msg = f" [{speed:.0f}px/s]" if speed > 0 else ""
+                logger.info(f"CLICK #{self.action_count}: {button} at ({x}, {y}){constrained_msg}{speed_msg} - {reason}")
             return action
             
         except Exception as e:
@@ -411,45 +1020,122 @@ class UniversalAIController:
                 "error": str(e),
                 "success": False
             }
-            self.session_log.append(error_action)
+            self._log_action(error_action)
             return error_action
     
+    def _plan_path(self, start_x, start_y, end_x, end_y, duration, eased=False):
+        """Precompute ~60Hz cursor samples from start to end (start excluded)
+        
+        Returns (points, interval): integer (x, y) pairs and the time between
+        them. With eased=True progress follows the easeInOutQuad curve.
+        """
+        steps = max(1, int(duration * 60))
+        
+        if HAS_NUMPY:
+            progress = np.linspace(0.0, 1.0, steps + 1)[1:]
+            if eased:
+                progress = np.where(progress < 0.5, 2 * progress * progress, 1 - (-2 * progress + 2) ** 2 / 2)
+            xs = np.rint(start_x + (end_x - start_x) * progress).astype(np.int32)
+            ys = np.rint(start_y + (end_y - start_y) * progress).astype(np.int32)
+            points = list(zip(xs.tolist(), ys.tolist()))
+        else:
+            points = []
+            for step in range(1, steps + 1):
+                progress = step / steps
+                if eased:
+                    progress = _ease_in_out_quad(progress)
+                points.append((
+                    round(start_x + (end_x - start_x) * progress),
+                    round(start_y + (end_y - start_y) * progress)
+                ))
+        
+        return points, duration / steps
+    
+    @staticmethod
+    def _dispatch_path(points, interval, send):
+        """Call send(x, y) for each point on a fixed cadence
+        
+        pyautogui's FAILSAFE is checked before every step, as its own
+        tweens did, so slamming the mouse into a corner aborts a glide or
+        drag part-way.
+        """
+        deadline = time.perf_counter()
+        for x, y in points:
+            pyautogui.failSafeCheck()
+            send(x, y)
+            deadline += interval
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+    
+    def _glide(self, x, y, duration, eased=False):
+        """Move the cursor to (x, y) over duration seconds with SetCursorPos"""
+        start_x, start_y = self._cursor_position()
+        points, interval = self._plan_path(start_x, start_y, x, y, duration, eased)
+        self._dispatch_path(points, interval, _win_input.set_cursor_pos)
+    
+    def _send_drag(self, start_x, start_y, end_x, end_y, duration):
+        """Press, move and release via SendInput, paced by our own clock
+        
+        The press and the release are each one batch; intermediate moves
+        are sent at ~60Hz so the app sees a continuous drag over duration.
+        """
+        screen = _win_input.virtual_screen()
+        _win_input.send_inputs([
+            _win_input.move_input(start_x, start_y, screen),
+            _win_input.mouse_input(_win_input.MOUSEEVENTF_LEFTDOWN)
+        ])
+        
+        try:
+            points, interval = self._plan_path(start_x, start_y, end_x, end_y, duration)
+            self._dispatch_path(
+                points, interval,
+                lambda x, y: _win_input.send_inputs([_win_input.move_input(x, y, screen)])
+            )
+        finally:
+            _win_input.send_inputs([_win_input.mouse_input(_win_input.MOUSEEVENTF_LEFTUP)])
+    
     def drag(self, start_x, start_y, end_x, end_y, duration=None, reason="manipulation"):
         """AI ACTION: Drag from start to end point with window constraints and speed limits"""
         self.action_count += 1
         
         try:
             # Constrain both start and end coordinates to window bounds
-            constrained_start_x, constrained_start_y, window_info = self._constrain_coordinates_to_window(start_x, start_y)
-            constrained_end_x, constrained_end_y, _ = self._constrain_coordinates_to_window(end_x, end_y)
+            window_info = self._get_target_window_bounds()
+            constrained_start_x, constrained_start_y, _ = self._constrain_coordinates_to_window(start_x, start_y, window_info)
+            constrained_end_x, constrained_end_y, _ = self._constrain_coordinates_to_window(end_x, end_y, window_info)
             
             # Calculate appropriate duration if not provided
+            drag_distance, drag_duration = self._calculate_movement(
+                constrained_start_x, constrained_start_y,
+                constrained_end_x, constrained_end_y,
+                window_info
+            )
             if duration is None:
-                duration = self._calculate_movement_duration(
-                    constrained_start_x, constrained_start_y,
-                    constrained_end_x, constrained_end_y,
-                    window_info
-                )
                 # Drag operations should be slightly slower for precision
-                duration = duration * 1.5  # 50% slower than regular movement
+                duration = drag_duration * 1.5  # 50% slower than regular movement
                 duration = max(0.2, min(duration, 4.0))  # 0.2s to 4.0s bounds
             
             # Move to start position first
-            current_pos = pyautogui.position()
-            move_duration = self._calculate_movement_duration(
-                current_pos.x, current_pos.y,
+            current_x, current_y = self._cursor_position()
+            _, move_duration = self._calculate_movement(
+                current_x, current_y,
                 constrained_start_x, constrained_start_y,
                 window_info
             )
             
-            pyautogui.moveTo(constrained_start_x, constrained_start_y, duration=move_duration)
-            time.sleep(0.1)
+            self._glide(constrained_start_x, constrained_start_y, move_duration)
+            self._last_cursor = (constrained_start_x, constrained_start_y)
+            if self.safe_mode:
+                time.sleep(0.1)
             
             # Perform drag to constrained end position
-            pyautogui.dragTo(constrained_end_x, constrained_end_y, duration=duration, button='left')
+            self._send_drag(
+                constrained_start_x, constrained_start_y,
+                constrained_end_x, constrained_end_y,
+                duration
+            )
+            self._last_cursor = (constrained_end_x, constrained_end_y)
             
-            # Calculate drag distance and speed for logging
-            drag_distance = ((constrained_end_x - constrained_start_x) ** 2 + (constrained_end_y - constrained_start_y) ** 2) ** 0.5
+            # Calculate drag speed for logging
             drag_speed = drag_distance / duration if duration > 0 else 0
             
             action = {
@@ -468,16 +1154,17 @@ class UniversalAIController:
                 },
                 "reason": reason,
                 "success": True,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+                "timestamp": self._ts()
             }
             
-            self.session_log.append(action)
-            constrained_msg = ""
-            if (constrained_start_x != start_x or constrained_start_y != start_y or 
-                constrained_end_x != end_x or constrained_end_y != end_y):
-                constrained_msg = f" -> ({constrained_start_x}, {constrained_start_y}) to ({constrained_end_x}, {constrained_end_y})"
-            speed_msg = f" [{drag_speed:.0f}px/s]" if drag_speed > 0 else ""
-            print(f"DRAG #{self.action_count}: ({start_x}, {start_y}) -> ({end_x}, {end_y}){constrained_msg}{speed_msg} - {reason}")
+            self._log_action(action)
+            if logger.isEnabledFor(logging.INFO):
+                constrained_msg = ""
+                if (constrained_start_x != start_x or constrained_start_y != start_y or 
+                    constrained_end_x != end_x or constrained_end_y != end_y):
+                    constrained_msg = f" -> ({constrained_start_x}, {constrained_start_y}) to ({constrained_end_x}, {constrained_end_y})"
+                speed_msg = f" [{drag_speed:.0f}px/s]" if drag_speed > 0 else ""
+                logger.info(f"DRAG #{self.action_count}: ({start_x}, {start_y}) -> ({end_x}, {end_y}){constrained_msg}{speed_msg} - {reason}")
             return action
             
         except Exception as e:
@@ -487,7 +1174,7 @@ class UniversalAIController:
                 "error": str(e),
                 "success": False
             }
-            self.session_log.append(error_action)
+            self._log_action(error_action)
             return error_action
     
     def type_text(self, text, reason="input"):
@@ -495,7 +1182,17 @@ class UniversalAIController:
         self.action_count += 1
         
         try:
-            pyautogui.typewrite(text, interval=0.05)
+            # Unicode key events type any character, independent of layout;
+            # newlines, tabs and backspaces press their keys. The whole string
+            # goes out in one SendInput batch; safe_mode types it a character
+            # at a time, 0.05s apart
+            pyautogui.failSafeCheck()
+            if self.safe_mode:
+                for char in text:
+                    _win_input.send_inputs(_win_input.text_inputs(char))
+                    time.sleep(0.05)
+            elif text:
+                _win_input.send_inputs(_win_input.text_inputs(text))
             
             action = {
                 "action_id": self.action_count,
@@ -503,11 +1200,11 @@ class UniversalAIController:
                 "text": text,
                 "reason": reason,
                 "success": True,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+                "timestamp": self._ts()
             }
             
-            self.session_log.append(action)
-            print(f"TYPE #{self.action_count}: '{text}' - {reason}")
+            self._log_action(action)
+            logger.info("TYPE #%d: '%s' - %s", self.action_count, text, reason)
             return action
             
         except Exception as e:
@@ -517,7 +1214,7 @@ class UniversalAIController:
                 "error": str(e),
                 "success": False
             }
-            self.session_log.append(error_action)
+            self._log_action(error_action)
             return error_action
     
     def press_key(self, key, reason="shortcut"):
@@ -525,7 +1222,12 @@ class UniversalAIController:
         self.action_count += 1
         
         try:
-            pyautogui.press(key)
+            inputs = _win_input.key_press_inputs(key)
+            if inputs is None:
+                pyautogui.press(key)  # Key names outside _win_input.VK_CODES
+            else:
+                pyautogui.failSafeCheck()
+                _win_input.send_inputs(inputs)
             
             action = {
                 "action_id": self.action_count,
@@ -533,11 +1235,11 @@ class UniversalAIController:
                 "key": key,
                 "reason": reason,
                 "success": True,
-                "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+                "timestamp": self._ts()
             }
             
-            self.session_log.append(action)
-            print(f"KEY #{self.action_count}: '{key}' - {reason}")
+            self._log_action(action)
+            logger.info("KEY #%d: '%s' - %s", self.action_count, key, reason)
             return action
             
         except Exception as e:
@@ -547,14 +1249,17 @@ class UniversalAIController:
                 "error": str(e),
                 "success": False
             }
-            self.session_log.append(error_action)
+            self._log_action(error_action)
             return error_action
     
     def wait(self, seconds, reason="timing"):
         """AI ACTION: Wait for specified time"""
-        self.action_count += 1
-        
         time.sleep(seconds)
+        return self._record_wait(seconds, reason)
+    
+    def _record_wait(self, seconds, reason):
+        """Log a completed wait action"""
+        self.action_count += 1
         
         action = {
             "action_id": self.action_count,
@@ -562,37 +1267,67 @@ class UniversalAIController:
             "duration": seconds,
             "reason": reason,
             "success": True,
-            "timestamp": datetime.now().strftime("%H%M%S_%f")[:12]
+            "timestamp": self._ts()
         }
         
-        self.session_log.append(action)
-        print(f"WAIT #{self.action_count}: {seconds}s - {reason}")
+        self._log_action(action)
+        logger.info("WAIT #%d: %ss - %s", self.action_count, seconds, reason)
         return action
     
+    # Async API: the same actions, awaitable from an event loop. Blocking
+    # input/capture work runs on one dedicated thread so actions stay
+    # ordered and the loop stays free for AI reasoning and other tasks.
+    
+    async def _run_in_action_thread(self, method, *args, **kwargs):
+        """Run a blocking action method on the controller's action thread"""
+        if self._action_executor is None:
+            self._action_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai_controller")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._action_executor, functools.partial(method, *args, **kwargs))
+    
+    async def see_async(self, context="observation"):
+        """Awaitable see()"""
+        return await self._run_in_action_thread(self.see, context)
+    
+    async def move_to_async(self, x, y, smooth=True, reason="navigation"):
+        """Awaitable move_to()"""
+        return await self._run_in_action_thread(self.move_to, x, y, smooth, reason)
+    
+    async def click_async(self, x, y, button="left", clicks=1, reason="interaction"):
+        """Awaitable click()"""
+        return await self._run_in_action_thread(self.click, x, y, button, clicks, reason)
+    
+    async def drag_async(self, start_x, start_y, end_x, end_y, duration=None, reason="manipulation"):
+        """Awaitable drag()"""
+        return await self._run_in_action_thread(self.drag, start_x, start_y, end_x, end_y, duration, reason)
+    
+    async def type_text_async(self, text, reason="input"):
+        """Awaitable type_text()"""
+        return await self._run_in_action_thread(self.type_text, text, reason)
+    
+    async def press_key_async(self, key, reason="shortcut"):
+        """Awaitable press_key()"""
+        return await self._run_in_action_thread(self.press_key, key, reason)
+    
+    async def wait_async(self, seconds, reason="timing"):
+        """Awaitable wait() that yields to the event loop instead of sleeping the thread"""
+        await asyncio.sleep(seconds)
+        return await self._run_in_action_thread(self._record_wait, seconds, reason)
+    
     def focus_app(self):
         """Find and focus the spaceship application window"""
+        for hwnd, title in self._whitelisted_windows():
+            try:
+                win32gui.SetForegroundWindow(hwnd)
+                # We just made this the foreground window; prime the title
+                # cache so the next security check needs no win32 round trip
+                self._fg_cache = (hwnd, title, time.monotonic())
+                logger.info("Focused window: %s", title)
+                return True
+            except:
+                pass
         
-        def enum_window_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                if window_text:
-                    windows.append((hwnd, window_text))
-            return True
-        
-        windows = []
-        win32gui.EnumWindows(enum_window_callback, windows)
-        
-        # Look for spaceship app windows
-        for hwnd, title in windows:
-            if any(whitelist_name.lower() in title.lower() for whitelist_name in self.window_whitelist):
-                try:
-                    win32gui.SetForegroundWindow(hwnd)
-                    print(f"Focused window: {title}")
-                    return True
-                except:
-                    pass
-        
-        print("Could not find spaceship application window")
+        logger.warning("Could not find spaceship application window")
         return False
     
     def get_whitelist(self):
@@ -610,6 +1345,9 @@ class UniversalAIController:
     
     def save_session(self):
         """Save complete session log with security information"""
+        # Opening the session settles the session id (see _open_session)
+        if self._log_fp is None:
+            self._open_session()
         session_file = self.session_dir / f"session_{self.session_id}.json"
         
         session_summary = {
@@ -618,16 +1356,47 @@ class UniversalAIController:
             "security_violations": self.security_violations,
             "window_whitelist": self.window_whitelist,
             "security_summary": self.get_security_summary(),
-            "start_time": self.session_log[0]["timestamp"] if self.session_log else None,
-            "end_time": self.session_log[-1]["timestamp"] if self.session_log else None,
-            "actions": self.session_log
+            "start_time": self._start_time,
+            "end_time": self._end_time,
+            "actions_file": str(self.actions_file)
         }
         
-        with open(session_file, 'w') as f:
-            json.dump(session_summary, f, indent=2)
+        # Per-action entries (and packed frames) are already streamed to disk;
+        # screenshot files may still be encoding on the save thread
+        self._wait_for_saves()
+        self._sync_logs()
+        with open(session_file, 'wb') as f:
+            f.write(_dumps(session_summary))
         
-        print(f"Session saved: {session_file}")
-        print(f"Security summary: {self.get_security_summary()}")
+        logger.info("Session saved: %s", session_file)
+        logger.info("Security summary: %s", self.get_security_summary())
         return session_file
+    
+    def close(self):
+        """Flush and close the action and frame logs and release capture resources
+        
+        The controller stays usable: later actions reopen the logs for
+        appending and recreate the worker threads and grabbers on demand.
+        """
+        if self._action_executor is not None:
+            self._action_executor.shutdown(wait=True)
+            self._action_executor = None
+        self._wait_for_saves()
+        if self._save_pool is not None:
+            self._save_pool.shutdown()
+            self._save_pool = None
+        self._sync_logs()
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+            self._log_mode = "ab"
+        if self._frames_fp is not None:
+            self._frames_fp.close()
+            self._frames_fp = None
+        for sct in self._sct_instances:
+            sct.close()
+        self._sct_instances.clear()
+        self._sct_local = threading.local()
+        self._release_gdi()
 
 # No command-line interface - Pure controller class for AI integration only
\ No newline at end of file